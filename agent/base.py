@@ -76,6 +76,7 @@ class BaseAgent(ABC):
             self.memory.llm = llm
             if hasattr(self.memory, "compressor") and self.memory.compressor:
                 self.memory.compressor.llm = llm
+            self.memory.recount_tokens()
 
     @abstractmethod
     def run(self, task: str) -> str:
@@ -252,7 +253,7 @@ class BaseAgent(ABC):
                 result = await self.tool_executor.execute_tool_call(tc.name, tc.arguments)
 
             terminal_ui.print_tool_result(result)
-            logger.debug(f"Tool result: {result[:200]}{'...' if len(result) > 200 else ''}")
+            logger.debug("Tool result: %.200s%s", result, "..." if len(result) > 200 else "")
 
             tool_results.append(ToolResult(tool_call_id=tc.id, content=result, name=tc.name))
         return tool_results
@@ -283,7 +284,9 @@ class BaseAgent(ABC):
         tool_results: List[ToolResult] = []
         for i, tc in enumerate(tool_calls):
             terminal_ui.print_tool_result(results[i])
-            logger.debug(f"Tool result: {results[i][:200]}{'...' if len(results[i]) > 200 else ''}")
+            logger.debug(
+                "Tool result: %.200s%s", results[i], "..." if len(results[i]) > 200 else ""
+            )
             tool_results.append(ToolResult(tool_call_id=tc.id, content=results[i], name=tc.name))
         return tool_results
 
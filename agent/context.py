@@ -117,10 +117,12 @@ async def get_context_dict() -> Dict[str, Any]:
     Returns:
         Dictionary with all context information
     """
+    git_status = await get_git_status()
+    now = datetime.now()
     return {
         "working_directory": get_working_directory(),
         "platform": get_platform_info(),
-        "git": await get_git_status(),
-        "date": datetime.now().strftime("%Y-%m-%d"),
-        "timestamp": datetime.now().isoformat(),
+        "git": git_status,
+        "date": now.strftime("%Y-%m-%d"),
+        "timestamp": now.isoformat(),
     }
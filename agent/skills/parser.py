@@ -9,6 +9,8 @@ import aiofiles
 import aiofiles.os
 import yaml
 
+from utils.yaml_safe import SafeLoader
+
 
 def split_frontmatter(text: str) -> tuple[dict[str, object], str]:
     lines = text.splitlines()
@@ -28,7 +30,7 @@ def split_frontmatter(text: str) -> tuple[dict[str, object], str]:
     body = "\n".join(lines[end_idx + 1 :])
 
     try:
-        data = yaml.safe_load(yaml_text) or {}
+        data = yaml.load(yaml_text, Loader=SafeLoader) or {}
     except yaml.YAMLError:
         return {}, text
 
@@ -1,5 +1,6 @@
 """Todo list management for agents to track complex multi-step tasks."""
 
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List
@@ -13,7 +14,14 @@ class TodoStatus(Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+_STATUS_SYMBOLS = {
+    TodoStatus.PENDING: "⏳",
+    TodoStatus.IN_PROGRESS: "🔄",
+    TodoStatus.COMPLETED: "✅",
+}
+
+
+@dataclass(slots=True)
 class TodoItem:
     """A single todo item."""
 
@@ -31,6 +39,9 @@ class TodoList:
 
     def __init__(self) -> None:
         self._items: List[TodoItem] = []
+        # Per-status item counts, kept in step with _items so summaries and the
+        # single-in_progress check don't rescan the whole list.
+        self._status_counts: Counter[TodoStatus] = Counter()
 
     def add(self, content: str, activeForm: str) -> str:
         """Add a new todo item.
@@ -47,6 +58,7 @@ class TodoList:
 
         item = TodoItem(content=content, activeForm=activeForm, status=TodoStatus.PENDING)
         self._items.append(item)
+        self._status_counts[TodoStatus.PENDING] += 1
         return f"Added todo #{len(self._items)}: {content}"
 
     def update_status(self, index: int, status: str) -> str:
@@ -68,20 +80,16 @@ class TodoList:
             return f"Error: Invalid status '{status}'. Must be: pending, in_progress, or completed"
 
         # Check the ONE in_progress rule
-        if new_status == TodoStatus.IN_PROGRESS:
-            in_progress_count = sum(
-                1 for item in self._items if item.status == TodoStatus.IN_PROGRESS
+        if new_status is TodoStatus.IN_PROGRESS and self._status_counts[TodoStatus.IN_PROGRESS]:
+            current = next(
+                i for i, item in enumerate(self._items, 1) if item.status is TodoStatus.IN_PROGRESS
             )
-            if in_progress_count > 0:
-                in_progress_items = [
-                    i + 1
-                    for i, item in enumerate(self._items)
-                    if item.status == TodoStatus.IN_PROGRESS
-                ]
-                return f"Error: Task #{in_progress_items[0]} is already in_progress. Complete it first before starting another task."
+            return f"Error: Task #{current} is already in_progress. Complete it first before starting another task."
 
         item = self._items[index - 1]
         old_status = item.status.value
+        self._status_counts[item.status] -= 1
+        self._status_counts[new_status] += 1
         item.status = new_status
 
         return f"Updated todo #{index} status: {old_status} → {status}"
@@ -103,6 +111,7 @@ class TodoList:
             return f"Error: Invalid index {index}. Valid range: 1-{len(self._items)}"
 
         item = self._items.pop(index - 1)
+        self._status_counts[item.status] -= 1
         return f"Removed todo: {item.content}"
 
     def format_list(self) -> str:
@@ -112,19 +121,14 @@ class TodoList:
 
         lines = ["Current Todo List:"]
         for i, item in enumerate(self._items, 1):
-            status_symbol = {
-                TodoStatus.PENDING: "⏳",
-                TodoStatus.IN_PROGRESS: "🔄",
-                TodoStatus.COMPLETED: "✅",
-            }[item.status]
-
-            status_text = item.activeForm if item.status == TodoStatus.IN_PROGRESS else item.content
+            status_symbol = _STATUS_SYMBOLS[item.status]
+            status_text = item.activeForm if item.status is TodoStatus.IN_PROGRESS else item.content
             lines.append(f"{i}. {status_symbol} [{item.status.value}] {status_text}")
 
         # Summary
-        pending = sum(1 for item in self._items if item.status == TodoStatus.PENDING)
-        in_progress = sum(1 for item in self._items if item.status == TodoStatus.IN_PROGRESS)
-        completed = sum(1 for item in self._items if item.status == TodoStatus.COMPLETED)
+        pending = self._status_counts[TodoStatus.PENDING]
+        in_progress = self._status_counts[TodoStatus.IN_PROGRESS]
+        completed = self._status_counts[TodoStatus.COMPLETED]
 
         lines.append(
             f"\nSummary: {completed} completed, {in_progress} in progress, {pending} pending"
@@ -136,14 +140,15 @@ class TodoList:
         """Get summary statistics."""
         return {
             "total": len(self._items),
-            "pending": sum(1 for item in self._items if item.status == TodoStatus.PENDING),
-            "in_progress": sum(1 for item in self._items if item.status == TodoStatus.IN_PROGRESS),
-            "completed": sum(1 for item in self._items if item.status == TodoStatus.COMPLETED),
+            "pending": self._status_counts[TodoStatus.PENDING],
+            "in_progress": self._status_counts[TodoStatus.IN_PROGRESS],
+            "completed": self._status_counts[TodoStatus.COMPLETED],
         }
 
     def clear_completed(self) -> str:
         """Remove all completed items."""
         before_count = len(self._items)
-        self._items = [item for item in self._items if item.status != TodoStatus.COMPLETED]
+        self._items = [item for item in self._items if item.status is not TodoStatus.COMPLETED]
         removed = before_count - len(self._items)
+        self._status_counts[TodoStatus.COMPLETED] = 0
         return f"Removed {removed} completed todo(s)"
@@ -1,7 +1,7 @@
 """Tool execution engine for managing and executing tools."""
 
 import asyncio
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from config import Config
 from tools.base import BaseTool
@@ -13,6 +13,7 @@ class ToolExecutor:
     def __init__(self, tools: List[BaseTool]):
         """Initialize with a list of tools."""
         self.tools = {tool.name: tool for tool in tools}
+        self._schemas: Optional[List[Dict[str, Any]]] = None
 
     async def execute_tool_call(self, tool_name: str, tool_input: Dict[str, Any]) -> str:
         """Execute a single tool call and return result."""
@@ -47,8 +48,14 @@ class ToolExecutor:
         return tool.readonly if tool else False
 
     def get_tool_schemas(self) -> List[Dict[str, Any]]:
-        """Get Anthropic-formatted schemas for all tools."""
-        return [tool.to_anthropic_schema() for tool in self.tools.values()]
+        """Get Anthropic-formatted schemas for all tools.
+
+        The list is built once and shared until the tool set changes; callers
+        must not modify it.
+        """
+        if self._schemas is None:
+            self._schemas = [tool.to_anthropic_schema() for tool in self.tools.values()]
+        return self._schemas
 
     def add_tool(self, tool: BaseTool):
         """Add a tool to the executor.
@@ -57,3 +64,4 @@ class ToolExecutor:
             tool: Tool instance to add
         """
         self.tools[tool.name] = tool
+        self._schemas = None
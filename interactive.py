@@ -1,8 +1,9 @@
 """Interactive multi-turn conversation mode for the agent."""
 
 import asyncio
-import shlex
+import inspect
 import signal
+from collections.abc import Awaitable, Callable
 
 from rich.table import Table
 
@@ -27,12 +28,39 @@ from utils.tui.model_ui import (
     open_config_and_wait_for_save,
     parse_kv_args,
     pick_model_id,
+    split_command_args,
 )
 from utils.tui.oauth_ui import pick_oauth_provider
 from utils.tui.skills_ui import SkillsAction, pick_skills_action
 from utils.tui.status_bar import StatusBar
 from utils.tui.theme import Theme, set_theme
 
+CommandHandler = Callable[[str, str], Awaitable[bool | None] | bool | None]
+
+
+def _format_model_lines(models, current, default_model_id: str | None) -> str:
+    """Render the numbered model list with CURRENT/DEFAULT markers."""
+    colors = Theme.get_colors()
+    current_id = current.model_id if current else None
+    current_marker = f"[{colors.success}]CURRENT[/{colors.success}]"
+    default_marker = f"[{colors.primary}]DEFAULT[/{colors.primary}]"
+    blank_marker = f"[{colors.text_muted}]      [/{colors.text_muted}]"
+
+    lines = []
+    for i, model in enumerate(models, start=1):
+        is_current = bool(current_id) and model.model_id == current_id
+        is_default = bool(default_model_id) and model.model_id == default_model_id
+        if is_current and is_default:
+            marker = f"{current_marker} {default_marker}"
+        elif is_current:
+            marker = current_marker
+        elif is_default:
+            marker = default_marker
+        else:
+            marker = blank_marker
+        lines.append(f"  {marker} [{colors.text_muted}]{i:>2}[/] {model.model_id}")
+    return "\n".join(lines)
+
 
 class InteractiveSession:
     """Manages an interactive conversation session with the agent."""
@@ -98,8 +126,14 @@ class InteractiveSession:
         # Initialize status bar
         self.status_bar = StatusBar(terminal_ui.console)
         self.status_bar.update(mode="LOOP")
+        # Stats last pushed to the status bar, to skip no-op updates
+        self._last_stats_sig: tuple | None = None
         self.skills_registry = SkillsRegistry()
 
+        # Rendered help text keyed by theme name
+        self._help_cache: dict[str, str] = {}
+        self._command_handlers = self._build_command_handlers()
+
         # Set up signal handler for graceful interruption
         self._setup_signal_handler()
 
@@ -134,42 +168,42 @@ class InteractiveSession:
 
     def _show_help(self) -> None:
         """Display help message with available commands."""
+        # The help body only depends on the static command registry and the
+        # active theme, so render it once per theme and emit a single print.
+        theme_name = Theme.get_theme_name()
+        help_text = self._help_cache.get(theme_name)
+        if help_text is None:
+            help_text = self._render_help()
+            self._help_cache[theme_name] = help_text
+        terminal_ui.console.print(help_text)
+
+    def _render_help(self) -> str:
+        """Build the Rich markup for the help message using the current theme."""
         colors = Theme.get_colors()
-        terminal_ui.console.print(
-            f"\n[bold {colors.primary}]Available Commands:[/bold {colors.primary}]"
-        )
+        lines = [f"\n[bold {colors.primary}]Available Commands:[/bold {colors.primary}]"]
         for cmd in self.command_registry.commands:
-            terminal_ui.console.print(
+            lines.append(
                 f"  [{colors.primary}]{cmd.display}[/{colors.primary}] - {cmd.description}"
             )
             if cmd.subcommands:
                 for sub_name, sub in cmd.subcommands.items():
                     extra = f" {sub.args_hint}" if sub.args_hint else ""
-                    terminal_ui.console.print(
+                    lines.append(
                         f"    [{colors.text_muted}]/{cmd.name} {sub_name}{extra} - {sub.description}[/{colors.text_muted}]"
                     )
 
-        terminal_ui.console.print(
-            f"\n[bold {colors.primary}]Keyboard Shortcuts:[/bold {colors.primary}]"
-        )
-        terminal_ui.console.print(
-            f"  [{colors.secondary}]/[/{colors.secondary}]            - Show command suggestions"
-        )
-        terminal_ui.console.print(
-            f"  [{colors.secondary}]Ctrl+C[/{colors.secondary}]     - Cancel current operation"
-        )
-        terminal_ui.console.print(
-            f"  [{colors.secondary}]Ctrl+L[/{colors.secondary}]     - Clear screen"
-        )
-        terminal_ui.console.print(
-            f"  [{colors.secondary}]Ctrl+T[/{colors.secondary}]     - Toggle thinking display"
-        )
-        terminal_ui.console.print(
-            f"  [{colors.secondary}]Ctrl+S[/{colors.secondary}]     - Show quick stats"
-        )
-        terminal_ui.console.print(
-            f"  [{colors.secondary}]Up/Down[/{colors.secondary}]    - Navigate command history\n"
+        lines.extend(
+            [
+                f"\n[bold {colors.primary}]Keyboard Shortcuts:[/bold {colors.primary}]",
+                f"  [{colors.secondary}]/[/{colors.secondary}]            - Show command suggestions",
+                f"  [{colors.secondary}]Ctrl+C[/{colors.secondary}]     - Cancel current operation",
+                f"  [{colors.secondary}]Ctrl+L[/{colors.secondary}]     - Clear screen",
+                f"  [{colors.secondary}]Ctrl+T[/{colors.secondary}]     - Toggle thinking display",
+                f"  [{colors.secondary}]Ctrl+S[/{colors.secondary}]     - Show quick stats",
+                f"  [{colors.secondary}]Up/Down[/{colors.secondary}]    - Navigate command history\n",
+            ]
         )
+        return "\n".join(lines)
 
     def _show_stats(self) -> None:
         """Display current memory and token statistics."""
@@ -206,12 +240,18 @@ class InteractiveSession:
                 table.add_column("Msgs", justify="right", width=6)
                 table.add_column("Preview", width=50)
 
-                for i, session in enumerate(sessions, 1):
-                    sid = session["id"]
-                    updated = session.get("updated_at", session.get("created_at", ""))[:19]
-                    msg_count = str(session["message_count"])
-                    preview = session.get("preview", "")[:50]
-                    table.add_row(str(i), sid, updated, msg_count, preview)
+                rows = [
+                    (
+                        str(i),
+                        session["id"],
+                        session.get("updated_at", session.get("created_at", ""))[:19],
+                        str(session["message_count"]),
+                        session.get("preview", "")[:50],
+                    )
+                    for i, session in enumerate(sessions, 1)
+                ]
+                for row in rows:
+                    table.add_row(*row)
 
                 terminal_ui.console.print(table)
                 terminal_ui.console.print(
@@ -310,17 +350,34 @@ class InteractiveSession:
             )
         self._update_status_bar()
 
-    def _update_status_bar(self) -> None:
-        """Update status bar with current stats."""
+    def _update_status_bar(self, is_processing: bool | None = None) -> None:
+        """Update status bar with current stats.
+
+        Args:
+            is_processing: Optionally set the processing indicator in the same update
+        """
+        if not Config.TUI_STATUS_BAR:
+            return
         stats = self.agent.memory.get_stats()
         model_info = self.agent.get_current_model_info()
         model_name = model_info["name"] if model_info else ""
+        sig = (
+            stats.get("total_input_tokens", 0),
+            stats.get("total_output_tokens", 0),
+            stats.get("current_tokens", 0),
+            stats.get("total_cost", 0),
+            model_name,
+        )
+        if sig == self._last_stats_sig and is_processing is None:
+            return
+        self._last_stats_sig = sig
         self.status_bar.update(
-            input_tokens=stats.get("total_input_tokens", 0),
-            output_tokens=stats.get("total_output_tokens", 0),
-            context_tokens=stats.get("current_tokens", 0),
-            cost=stats.get("total_cost", 0),
+            input_tokens=sig[0],
+            output_tokens=sig[1],
+            context_tokens=sig[2],
+            cost=sig[3],
             model_name=model_name,
+            is_processing=is_processing,
         )
 
     async def _handle_command(self, user_input: str) -> bool | None:
@@ -332,55 +389,11 @@ class InteractiveSession:
         Returns:
             True if command was handled, False if should exit, None if not handled
         """
-        command_parts = user_input.split()
-        command = command_parts[0].lower()
+        head, _, tail = user_input.partition(" ")
+        command = head.lower()
 
-        if command in ("/exit", "/quit"):
-            colors = Theme.get_colors()
-            terminal_ui.console.print(
-                f"\n[bold {colors.warning}]Exiting interactive mode. Goodbye![/bold {colors.warning}]"
-            )
-            return False
-
-        elif command == "/help":
-            self._show_help()
-
-        elif command == "/reset":
-            self.agent.memory.reset()
-            self.conversation_count = 0
-            self._update_status_bar()
-            terminal_ui.print_success("Memory cleared. Starting fresh conversation.")
-            terminal_ui.console.print()
-
-        elif command == "/stats":
-            self._show_stats()
-
-        elif command == "/resume":
-            session_id = command_parts[1] if len(command_parts) >= 2 else None
-            await self._resume_session(session_id)
-
-        elif command == "/theme":
-            self._toggle_theme()
-
-        elif command == "/verbose":
-            self._toggle_verbose()
-
-        elif command == "/compact":
-            await self._compact_memory()
-
-        elif command == "/model":
-            await self._handle_model_command(user_input)
-
-        elif command == "/login":
-            await self._handle_login_command(command_parts)
-
-        elif command == "/logout":
-            await self._handle_logout_command(command_parts)
-
-        elif command == "/skills":
-            await self._handle_skills_menu()
-
-        else:
+        handler = self._command_handlers.get(command)
+        if handler is None:
             colors = Theme.get_colors()
             terminal_ui.console.print(
                 f"[bold {colors.error}]Unknown command: {command}[/bold {colors.error}]"
@@ -390,7 +403,48 @@ class InteractiveSession:
             )
             return True
 
-        return True
+        result = handler(user_input, tail.strip())
+        if inspect.isawaitable(result):
+            result = await result
+        return result is not False
+
+    def _build_command_handlers(self) -> dict[str, CommandHandler]:
+        """Map each slash command to its handler.
+
+        Handlers receive the raw input and the argument text after the command.
+        They may be sync or async, and return False only to end the session.
+        """
+        return {
+            "/exit": lambda _input, _args: self._exit_session(),
+            "/quit": lambda _input, _args: self._exit_session(),
+            "/help": lambda _input, _args: self._show_help(),
+            "/reset": lambda _input, _args: self._reset_conversation(),
+            "/stats": lambda _input, _args: self._show_stats(),
+            "/resume": lambda _input, args: self._resume_session(args.split()[0] if args else None),
+            "/theme": lambda _input, _args: self._toggle_theme(),
+            "/verbose": lambda _input, _args: self._toggle_verbose(),
+            "/compact": lambda _input, _args: self._compact_memory(),
+            "/model": lambda user_input, _args: self._handle_model_command(user_input),
+            "/login": lambda user_input, _args: self._handle_login_command(user_input.split()),
+            "/logout": lambda user_input, _args: self._handle_logout_command(user_input.split()),
+            "/skills": lambda _input, _args: self._handle_skills_menu(),
+        }
+
+    def _exit_session(self) -> bool:
+        """Print the goodbye message and signal the run loop to stop."""
+        colors = Theme.get_colors()
+        terminal_ui.console.print(
+            f"\n[bold {colors.warning}]Exiting interactive mode. Goodbye![/bold {colors.warning}]"
+        )
+        return False
+
+    def _reset_conversation(self) -> None:
+        """Clear conversation memory and start fresh."""
+        self.agent.memory.reset()
+        self.conversation_count = 0
+        self._update_status_bar()
+        terminal_ui.print_success("Memory cleared. Starting fresh conversation.")
+        terminal_ui.console.print()
 
     async def _handle_skills_menu(self) -> None:
         action = await pick_skills_action()
@@ -461,21 +515,7 @@ class InteractiveSession:
             )
             return
 
-        for i, profile in enumerate(profiles, start=1):
-            markers: list[str] = []
-            if current and profile.model_id == current.model_id:
-                markers.append(f"[{colors.success}]CURRENT[/{colors.success}]")
-            if default_model_id and profile.model_id == default_model_id:
-                markers.append(f"[{colors.primary}]DEFAULT[/{colors.primary}]")
-            marker = (
-                " ".join(markers)
-                if markers
-                else f"[{colors.text_muted}]      [/{colors.text_muted}]"
-            )
-
-            terminal_ui.console.print(
-                f"  {marker} [{colors.text_muted}]{i:>2}[/] {profile.model_id}"
-            )
+        terminal_ui.console.print(_format_model_lines(profiles, current, default_model_id))
 
         terminal_ui.console.print(
             f"\n[{colors.text_muted}]Tip: run /model to pick; /model edit to change config.[/]\n"
@@ -531,7 +571,7 @@ class InteractiveSession:
         colors = Theme.get_colors()
 
         try:
-            parts = shlex.split(user_input)
+            parts = split_command_args(user_input)
         except ValueError as e:
             terminal_ui.print_error(str(e), title="Invalid /model command")
             return
@@ -784,9 +824,8 @@ class InteractiveSession:
                     terminal_ui.print_assistant_message(result)
 
                     # Update status bar
-                    self._update_status_bar()
+                    self._update_status_bar(is_processing=False)
                     if Config.TUI_STATUS_BAR:
-                        self.status_bar.update(is_processing=False)
                         self.status_bar.show()
 
                 except asyncio.CancelledError:
@@ -895,18 +934,7 @@ class ModelSetupSession:
             )
             return
 
-        for i, model in enumerate(models, start=1):
-            markers: list[str] = []
-            if current and model.model_id == current.model_id:
-                markers.append(f"[{colors.success}]CURRENT[/{colors.success}]")
-            if default_model_id and model.model_id == default_model_id:
-                markers.append(f"[{colors.primary}]DEFAULT[/{colors.primary}]")
-            marker = (
-                " ".join(markers)
-                if markers
-                else f"[{colors.text_muted}]      [/{colors.text_muted}]"
-            )
-            terminal_ui.console.print(f"  {marker} [{colors.text_muted}]{i:>2}[/] {model.model_id}")
+        terminal_ui.console.print(_format_model_lines(models, current, default_model_id))
 
         terminal_ui.console.print()
         terminal_ui.console.print(
@@ -923,7 +951,7 @@ class ModelSetupSession:
         colors = Theme.get_colors()
 
         try:
-            parts = shlex.split(user_input)
+            parts = split_command_args(user_input)
         except ValueError as e:
             terminal_ui.print_error(str(e), title="Invalid /model command")
             return False
@@ -1018,8 +1046,7 @@ class ModelSetupSession:
                     )
                     continue
 
-            parts = user_input.split()
-            cmd = parts[0].lower()
+            cmd = user_input.partition(" ")[0].lower()
 
             if cmd in ("/exit", "/quit"):
                 return False
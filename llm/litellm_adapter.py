@@ -2,6 +2,7 @@
 
 import json
 import logging
+import sys
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import litellm
@@ -52,6 +53,10 @@ class LiteLLMAdapter:
         self.drop_params = kwargs.pop("drop_params", True)
         self.timeout = kwargs.pop("timeout", 600)
 
+        # Last tools list passed to _convert_tools and its converted form. The
+        # agent loop passes the same schema list on every iteration of a task.
+        self._converted_tools: Optional[Tuple[List[Dict[str, Any]], List[Dict]]] = None
+
         # Configure LiteLLM global settings
         litellm.drop_params = self.drop_params
         litellm.set_verbose = False  # Disable verbose output
@@ -122,16 +127,20 @@ class LiteLLMAdapter:
         )
 
         logger.debug(
-            f"Calling LiteLLM async with model: {self.model}, messages: {len(litellm_messages)}, tools: {len(tools) if tools else 0}"
+            "Calling LiteLLM async with model: %s, messages: %d, tools: %d",
+            self.model,
+            len(litellm_messages),
+            len(tools) if tools else 0,
         )
         response = await self._make_api_call_async(**call_params)
 
-        if hasattr(response, "usage") and response.usage:
-            usage = response.usage
+        usage = getattr(response, "usage", None)
+        if usage:
             logger.debug(
-                f"Token Usage: Input={usage.get('prompt_tokens', 0)}, "
-                f"Output={usage.get('completion_tokens', 0)}, "
-                f"Total={usage.get('total_tokens', 0)}"
+                "Token Usage: Input=%s, Output=%s, Total=%s",
+                usage.get("prompt_tokens", 0),
+                usage.get("completion_tokens", 0),
+                usage.get("total_tokens", 0),
             )
 
         return self._convert_response(response)
@@ -142,74 +151,82 @@ class LiteLLMAdapter:
         Handles both new format (tool_calls field, tool role) and legacy format
         (tool_result blocks in user content).
         """
-        litellm_messages = []
+        litellm_messages: List[Dict] = []
+        converters = self._ROLE_CONVERTERS
 
         for msg in messages:
-            # Handle system messages
-            if msg.role == "system":
-                content = msg.content if isinstance(msg.content, str) else extract_text(msg.content)
-                litellm_messages.append({"role": "system", "content": content})
-
-            # Handle tool messages (new OpenAI format)
-            elif msg.role == "tool":
-                litellm_messages.append(
-                    {
-                        "role": "tool",
-                        "content": msg.content or "",
-                        "tool_call_id": msg.tool_call_id or "",
-                    }
-                )
-
-            # Handle user messages
-            elif msg.role == "user":
-                if isinstance(msg.content, str):
-                    litellm_messages.append({"role": "user", "content": msg.content})
-                elif isinstance(msg.content, list):
-                    # Legacy: Handle tool results (Anthropic format)
-                    # Convert to tool messages for OpenAI compatibility
-                    tool_messages = self._convert_anthropic_tool_results(msg.content)
-                    if tool_messages:
-                        litellm_messages.extend(tool_messages)
-                    else:
-                        # Not tool results, extract text
-                        content = extract_text(msg.content)
-                        litellm_messages.append({"role": "user", "content": content})
-                else:
-                    content = extract_text(msg.content)
-                    litellm_messages.append({"role": "user", "content": content})
-
-            # Handle assistant messages
-            elif msg.role == "assistant":
-                assistant_msg: Dict[str, Any] = {"role": "assistant"}
-
-                # New format: tool_calls field
-                if hasattr(msg, "tool_calls") and msg.tool_calls:
-                    assistant_msg["tool_calls"] = msg.tool_calls
-                    # Content can be None or text
-                    if msg.content:
-                        assistant_msg["content"] = msg.content
-                    else:
-                        assistant_msg["content"] = None
-                # Simple string content
-                elif isinstance(msg.content, str):
-                    assistant_msg["content"] = msg.content
-                # Legacy: complex content (may contain tool calls)
-                else:
-                    # Extract tool calls from legacy format
-                    tool_calls = extract_tool_calls_from_content(msg.content)
-                    if tool_calls:
-                        assistant_msg["tool_calls"] = tool_calls
-                        # Also extract any text content
-                        text = extract_text(msg.content)
-                        assistant_msg["content"] = text if text else None
-                    else:
-                        content = extract_text(msg.content)
-                        assistant_msg["content"] = content if content else ""
-
-                litellm_messages.append(assistant_msg)
+            converter = converters.get(msg.role)
+            if converter is not None:
+                converter(self, msg, litellm_messages)
 
         return litellm_messages
 
+    def _convert_system_message(self, msg: LLMMessage, out: List[Dict]) -> None:
+        content = msg.content if isinstance(msg.content, str) else extract_text(msg.content)
+        out.append({"role": "system", "content": content})
+
+    def _convert_tool_message(self, msg: LLMMessage, out: List[Dict]) -> None:
+        # New OpenAI format
+        out.append(
+            {
+                "role": "tool",
+                "content": msg.content or "",
+                "tool_call_id": msg.tool_call_id or "",
+            }
+        )
+
+    def _convert_user_message(self, msg: LLMMessage, out: List[Dict]) -> None:
+        content = msg.content
+        if isinstance(content, str):
+            out.append({"role": "user", "content": content})
+            return
+
+        if isinstance(content, list):
+            # Legacy: Handle tool results (Anthropic format)
+            # Convert to tool messages for OpenAI compatibility
+            tool_messages = self._convert_anthropic_tool_results(content)
+            if tool_messages:
+                out.extend(tool_messages)
+                return
+
+        # Not tool results, extract text
+        out.append({"role": "user", "content": extract_text(content)})
+
+    def _convert_assistant_message(self, msg: LLMMessage, out: List[Dict]) -> None:
+        assistant_msg: Dict[str, Any] = {"role": "assistant"}
+        content = msg.content
+
+        # New format: tool_calls field
+        if msg.tool_calls:
+            assistant_msg["tool_calls"] = msg.tool_calls
+            # Content can be None or text
+            assistant_msg["content"] = content if content else None
+        # Simple string content
+        elif isinstance(content, str):
+            assistant_msg["content"] = content
+        # Legacy: complex content (may contain tool calls)
+        else:
+            # Extract tool calls from legacy format
+            tool_calls = extract_tool_calls_from_content(content)
+            if tool_calls:
+                assistant_msg["tool_calls"] = tool_calls
+                # Also extract any text content
+                text = extract_text(content)
+                assistant_msg["content"] = text if text else None
+            else:
+                text = extract_text(content)
+                assistant_msg["content"] = text if text else ""
+
+        out.append(assistant_msg)
+
+    # Role -> converter; roles not listed are dropped, as before
+    _ROLE_CONVERTERS = {
+        "system": _convert_system_message,
+        "tool": _convert_tool_message,
+        "user": _convert_user_message,
+        "assistant": _convert_assistant_message,
+    }
+
     def _convert_anthropic_tool_results(self, content: List) -> List[Dict]:
         """Convert Anthropic tool_result format to OpenAI tool messages.
 
@@ -252,7 +269,11 @@ class LiteLLMAdapter:
 
     def _convert_tools(self, tools: List[Dict[str, Any]]) -> List[Dict]:
         """Convert Anthropic tool format to OpenAI format."""
-        return [
+        cached = self._converted_tools
+        if cached is not None and cached[0] is tools:
+            return cached[1]
+
+        converted = [
             {
                 "type": "function",
                 "function": {
@@ -263,6 +284,8 @@ class LiteLLMAdapter:
             }
             for tool in tools
         ]
+        self._converted_tools = (tools, converted)
+        return converted
 
     def _convert_response(self, response) -> LLMResponse:
         """Convert LiteLLM response to LLMResponse with normalized content.
@@ -271,35 +294,34 @@ class LiteLLMAdapter:
         and normalize all content to ensure JSON serializability.
         """
         # Extract message from response
-        message = response.choices[0].message
+        choice = response.choices[0]
+        message = choice.message
 
         # Clean up provider_specific_fields (removes thought_signature, etc.)
         self._clean_message(message)
 
         # Determine stop reason (normalize to OpenAI format)
-        finish_reason = response.choices[0].finish_reason
-        stop_reason = StopReason.normalize(finish_reason or "stop")
+        stop_reason = StopReason.normalize(choice.finish_reason or "stop")
+
+        # Each attribute is read once; response objects resolve them dynamically
+        raw_content = getattr(message, "content", None)
 
         # Extract text content
         content = None
-        if hasattr(message, "content") and message.content:
-            content = (
-                message.content
-                if isinstance(message.content, str)
-                else extract_text(message.content)
-            )
+        if raw_content:
+            content = raw_content if isinstance(raw_content, str) else extract_text(raw_content)
 
         # Extract and normalize tool calls
-        tool_calls = None
-        if hasattr(message, "tool_calls") and message.tool_calls:
-            tool_calls = self._normalize_tool_calls(message.tool_calls)
+        raw_tool_calls = getattr(message, "tool_calls", None)
+        tool_calls = self._normalize_tool_calls(raw_tool_calls) if raw_tool_calls else None
 
         # Extract token usage
         usage_dict = None
-        if hasattr(response, "usage") and response.usage:
+        usage = getattr(response, "usage", None)
+        if usage:
             usage_dict = {
-                "input_tokens": response.usage.get("prompt_tokens", 0),
-                "output_tokens": response.usage.get("completion_tokens", 0),
+                "input_tokens": usage.get("prompt_tokens", 0),
+                "output_tokens": usage.get("completion_tokens", 0),
             }
 
         # Extract thinking content
@@ -329,11 +351,12 @@ class LiteLLMAdapter:
             if not isinstance(arguments, str):
                 arguments = json.dumps(arguments)
 
+            name = tc.function.name
             tool_call: ToolCallBlock = {
                 "id": tc.id,
                 "type": "function",
                 "function": {
-                    "name": tc.function.name,
+                    "name": sys.intern(name) if isinstance(name, str) else name,
                     "arguments": arguments,
                 },
             }
@@ -352,8 +375,9 @@ class LiteLLMAdapter:
         thinking_parts = []
 
         # Check for thinking_blocks (Anthropic extended thinking via LiteLLM)
-        if hasattr(message, "thinking_blocks") and message.thinking_blocks:
-            for block in message.thinking_blocks:
+        thinking_blocks = getattr(message, "thinking_blocks", None)
+        if thinking_blocks:
+            for block in thinking_blocks:
                 if hasattr(block, "thinking"):
                     thinking_parts.append(block.thinking)
                 elif isinstance(block, dict) and "thinking" in block:
@@ -362,12 +386,14 @@ class LiteLLMAdapter:
                     thinking_parts.append(block)
 
         # Check for reasoning_content (OpenAI o1 style)
-        if hasattr(message, "reasoning_content") and message.reasoning_content:
-            thinking_parts.append(message.reasoning_content)
+        reasoning_content = getattr(message, "reasoning_content", None)
+        if reasoning_content:
+            thinking_parts.append(reasoning_content)
 
         # Check content blocks for thinking type
-        if hasattr(message, "content") and isinstance(message.content, list):
-            for block in message.content:
+        content = getattr(message, "content", None)
+        if isinstance(content, list):
+            for block in content:
                 if isinstance(block, dict) and block.get("type") == "thinking":
                     thinking_parts.append(block.get("thinking", ""))
                 elif hasattr(block, "type") and block.type == "thinking":
@@ -427,15 +453,7 @@ class LiteLLMAdapter:
         Returns:
             List of LLMMessages with role="tool"
         """
-        return [
-            LLMMessage(
-                role="tool",
-                content=result.content,
-                tool_call_id=result.tool_call_id,
-                name=result.name if hasattr(result, "name") else None,
-            )
-            for result in results
-        ]
+        return [result.to_message() for result in results]
 
     @property
     def supports_tools(self) -> bool:
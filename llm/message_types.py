@@ -66,7 +66,7 @@ class StopReason:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMMessage:
     """Unified message format across all LLM providers.
 
@@ -140,7 +140,7 @@ class LLMMessage:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Unified response format across all LLM providers.
 
@@ -207,7 +207,7 @@ class LLMResponse:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """Parsed tool call for execution.
 
@@ -220,7 +220,7 @@ class ToolCall:
     arguments: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result from tool execution.
 
@@ -50,17 +50,27 @@ def _coerce_int(value: Any, default: int) -> int:
         return default
 
 
+_BOOL_STRINGS: dict[str, bool] = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "y": True,
+    "on": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "n": False,
+    "off": False,
+}
+
+
 def _coerce_bool(value: Any, default: bool) -> bool:
     if value is None:
         return default
     if isinstance(value, bool):
         return value
     if isinstance(value, str):
-        v = value.strip().lower()
-        if v in {"true", "1", "yes", "y", "on"}:
-            return True
-        if v in {"false", "0", "no", "n", "off"}:
-            return False
+        return _BOOL_STRINGS.get(value.strip().lower(), default)
     return default
 
 
@@ -150,11 +160,13 @@ class ModelManager:
         self._ensure_yaml()
         import yaml
 
+        from utils.yaml_safe import SafeLoader
+
         if not os.path.exists(self.config_path):
             self._create_default_config()
 
         with open(self.config_path, encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+            config = yaml.load(f, Loader=SafeLoader) or {}
 
         models = config.get("models") or {}
         if not isinstance(models, dict):
@@ -199,12 +211,19 @@ class ModelManager:
         self._ensure_yaml()
         import yaml
 
+        from utils.yaml_safe import SafeDumper
+
         config = {
             "models": {mid: profile.to_dict() for mid, profile in self.models.items()},
             "default": self.default_model_id,
         }
         header = "# Model Configuration\n# This file is gitignored - do not commit to version control\n\n"
-        body = yaml.safe_dump(config, sort_keys=False, allow_unicode=True)
+        body = yaml.dump(
+            config,
+            Dumper=SafeDumper,
+            sort_keys=False,
+            allow_unicode=True,
+        )
         self._atomic_write(header + body)
 
     def is_configured(self) -> bool:
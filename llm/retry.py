@@ -1,7 +1,10 @@
 """Retry utilities for LLM API calls using tenacity."""
 
 import asyncio
-from typing import Callable, TypeVar
+import re
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional, TypeVar
 
 from tenacity import retry, retry_if_exception, stop_after_attempt
 from tenacity.wait import wait_base
@@ -13,17 +16,39 @@ logger = get_logger(__name__)
 T = TypeVar("T")
 
 
+_RATE_LIMIT_INDICATORS = (
+    "429",
+    "rate limit",
+    "quota",
+    "too many requests",
+    "resourceexhausted",
+)
+_RETRYABLE_INDICATORS = (
+    "timeout",
+    "connection",
+    "server error",
+    "500",
+    "502",
+    "503",
+    "504",
+)
+_RETRYABLE_ERROR_TYPES = ("RateLimitError", "APIConnectionError")
+
+
+def _alternation(words) -> re.Pattern[str]:
+    return re.compile("|".join(map(re.escape, words)), re.IGNORECASE)
+
+
+# One case-insensitive scan per message instead of lower() plus a substring
+# search per indicator.
+_RATE_LIMIT_RE = _alternation(_RATE_LIMIT_INDICATORS)
+_RETRYABLE_RE = _alternation(_RATE_LIMIT_INDICATORS + _RETRYABLE_INDICATORS)
+_RETRYABLE_TYPE_RE = re.compile("|".join(_RETRYABLE_ERROR_TYPES))
+
+
 def is_rate_limit_error(error: BaseException) -> bool:
     """Check if an error is a rate limit error."""
-    error_str = str(error).lower()
-    rate_limit_indicators = [
-        "429",
-        "rate limit",
-        "quota",
-        "too many requests",
-        "resourceexhausted",
-    ]
-    return any(indicator in error_str for indicator in rate_limit_indicators)
+    return _RATE_LIMIT_RE.search(str(error)) is not None
 
 
 def is_retryable_error(error: BaseException) -> bool:
@@ -31,31 +56,67 @@ def is_retryable_error(error: BaseException) -> bool:
     if isinstance(error, asyncio.CancelledError):
         return False
 
-    if is_rate_limit_error(error):
-        return True
-
-    error_str = str(error).lower()
-    error_type = type(error).__name__
-
-    if "RateLimitError" in error_type or "APIConnectionError" in error_type:
+    if _RETRYABLE_TYPE_RE.search(type(error).__name__):
         return True
 
-    retryable_indicators = [
-        "timeout",
-        "connection",
-        "server error",
-        "500",
-        "502",
-        "503",
-        "504",
-    ]
-    return any(indicator in error_str for indicator in retryable_indicators)
+    return _RETRYABLE_RE.search(str(error)) is not None
+
+
+# "Retry-After: 20", "retryDelay": "20s", "Please retry in 20.5s"
+_RETRY_AFTER_RE = re.compile(
+    r"retry(?:[ _-]?after|[ _-]?delay|\s+in)\W{0,5}([0-9]+(?:\.[0-9]+)?)", re.IGNORECASE
+)
+
+
+def _parse_retry_after(value: Any) -> Optional[float]:
+    """Parse a Retry-After value given in seconds or as an HTTP date."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    return (when - datetime.now(when.tzinfo)).total_seconds()
+
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """Return the wait in seconds the server asked for, if the error carries one."""
+    hint = _parse_retry_after(getattr(error, "retry_after", None))
+    if hint is not None:
+        return hint
+
+    response = getattr(error, "response", None)
+    for headers in (
+        getattr(error, "litellm_response_headers", None),
+        getattr(response, "headers", None),
+    ):
+        if headers:
+            try:
+                value = headers.get("retry-after") or headers.get("Retry-After")
+            except AttributeError:
+                continue
+            hint = _parse_retry_after(value)
+            if hint is not None:
+                return hint
+
+    match = _RETRY_AFTER_RE.search(str(error))
+    return float(match.group(1)) if match else None
 
 
 class _ConfigBackoff(wait_base):
     def __call__(self, retry_state) -> float:
         attempt = max(retry_state.attempt_number - 1, 0)
-        return Config.get_retry_delay(attempt)
+        delay = Config.get_retry_delay(attempt)
+        error = retry_state.outcome.exception() if retry_state.outcome else None
+        hint = get_retry_after(error) if error else None
+        if hint is not None and hint > delay:
+            # Honor the server's back-off, within the configured ceiling
+            delay = min(hint, Config.RETRY_MAX_DELAY)
+        return delay
 
 
 def _log_before_sleep(retry_state) -> None:
@@ -63,7 +124,8 @@ def _log_before_sleep(retry_state) -> None:
     if not error:
         return
     error_type = "Rate limit" if is_rate_limit_error(error) else "Retryable"
-    delay = _ConfigBackoff()(retry_state)
+    # Report the (jittered) delay tenacity is about to sleep, not a fresh draw
+    delay = retry_state.next_action.sleep if retry_state.next_action else retry_state.upcoming_sleep
     logger.warning(f"{error_type} error: {error}")
     logger.warning(
         "Retrying in %.1fs... (attempt %s/%s)",
@@ -1,7 +1,8 @@
 """Memory compression using LLM-based summarization."""
 
 import logging
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from config import Config
 from llm.content_utils import extract_text
@@ -336,22 +337,23 @@ Original messages ({count} messages, ~{tokens} tokens):
             if i >= 0:
                 preserve_indices.add(i)
 
-        # Step 4: Ensure tool pairs stay together (iterate until stable)
-        # A single pass can miss pairs: e.g. pair [A, T1] is skipped because
-        # neither is preserved, then pair [A, T2] preserves A because T2 is in
-        # the recent window — but T1 was already skipped.  Fixed-point loop
-        # ensures all pairs containing a preserved index are fully preserved.
-        changed = True
-        while changed:
-            changed = False
-            for assistant_idx, user_idx in tool_pairs:
-                if assistant_idx in preserve_indices or user_idx in preserve_indices:
-                    if assistant_idx not in preserve_indices:
-                        preserve_indices.add(assistant_idx)
-                        changed = True
-                    if user_idx not in preserve_indices:
-                        preserve_indices.add(user_idx)
-                        changed = True
+        # Step 4: Ensure tool pairs stay together
+        # Pairs sharing a message (one assistant with several results, or a
+        # legacy user message answering several assistants) chain into groups:
+        # e.g. preserving T2 of [A, T2] preserves A, which must then pull in T1
+        # of [A, T1].  Walk the pair links from every preserved index so each
+        # group is preserved whole, in one pass over the pairs.
+        linked: Dict[int, List[int]] = defaultdict(list)
+        for assistant_idx, user_idx in tool_pairs:
+            linked[assistant_idx].append(user_idx)
+            linked[user_idx].append(assistant_idx)
+
+        stack = [i for i in preserve_indices if i in linked]
+        while stack:
+            for j in linked[stack.pop()]:
+                if j not in preserve_indices:
+                    preserve_indices.add(j)
+                    stack.append(j)
 
         # Step 5: Build preserved and to_compress lists
         preserved = []
@@ -49,8 +49,7 @@ class LongTermMemoryConsolidator:
     ) -> bool:
         """Check whether total memory content exceeds the consolidation threshold."""
         threshold = Config.LONG_TERM_MEMORY_CONSOLIDATION_THRESHOLD
-        total_text = self._format_memories_text(memories)
-        estimated_tokens = int(len(total_text) / _CHARS_PER_TOKEN)
+        estimated_tokens = int(self._memories_text_length(memories) / _CHARS_PER_TOKEN)
         return estimated_tokens > threshold
 
     async def consolidate(
@@ -87,6 +86,18 @@ class LongTermMemoryConsolidator:
                 parts.append(f"## {cat.value}\n{content}")
         return "\n\n".join(parts) if parts else "(empty)"
 
+    @staticmethod
+    def _memories_text_length(memories: dict[MemoryCategory, str]) -> int:
+        """Return ``len(_format_memories_text(memories))`` without building the text."""
+        lengths = [
+            len("## \n") + len(cat.value) + len(content)
+            for cat in MemoryCategory
+            if (content := memories.get(cat, "").strip())
+        ]
+        if not lengths:
+            return len("(empty)")
+        return sum(lengths) + len("\n\n") * (len(lengths) - 1)
+
     @staticmethod
     def _parse_response(
         text: str,
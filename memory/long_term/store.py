@@ -79,11 +79,12 @@ class GitMemoryStore:
         await self.ensure_repo()
         self._loaded_head = await self.get_current_head()
 
-        memories: dict[MemoryCategory, str] = {}
-        for cat in MemoryCategory:
-            path = os.path.join(self.memory_dir, f"{cat.value}.md")
-            memories[cat] = await asyncio.to_thread(self._read_file, path)
-        return memories
+        # Category files are independent; read them concurrently
+        categories = list(MemoryCategory)
+        contents = await asyncio.gather(
+            *(asyncio.to_thread(self._read_file, self._category_path(cat)) for cat in categories)
+        )
+        return dict(zip(categories, contents))
 
     @staticmethod
     def _read_file(path: str) -> str:
@@ -113,23 +114,26 @@ class GitMemoryStore:
         """
         await self.ensure_repo()
 
-        for cat in MemoryCategory:
-            path = os.path.join(self.memory_dir, f"{cat.value}.md")
-            content = memories.get(cat, "")
-            await asyncio.to_thread(self._write_file, path, content)
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(self._write_file, self._category_path(cat), memories.get(cat, ""))
+                for cat in MemoryCategory
+            )
+        )
 
         await self._run_git("add", "-A")
 
-        # Only commit if there are staged changes
+        # Commit optimistically; only when that fails check whether it was
+        # because nothing is staged, which is not an error.
         try:
-            await self._run_git("diff", "--cached", "--quiet")
-            # No changes staged — skip commit
-            return
-        except subprocess.CalledProcessError:
-            # Changes exist — proceed to commit
-            pass
-
-        await self._run_git("commit", "-m", message)
+            await self._run_git("commit", "-m", message)
+        except subprocess.CalledProcessError as commit_err:
+            try:
+                await self._run_git("diff", "--cached", "--quiet")
+            except subprocess.CalledProcessError:
+                # Changes are staged, so the commit itself failed
+                raise commit_err from None
+            # No changes staged — nothing to commit
 
     @staticmethod
     def _write_file(path: str, content: str) -> None:
@@ -141,15 +145,27 @@ class GitMemoryStore:
     # Helpers
     # ------------------------------------------------------------------
 
+    def _category_path(self, cat: MemoryCategory) -> str:
+        return os.path.join(self.memory_dir, f"{cat.value}.md")
+
     async def _run_git(self, *args: str) -> str:
-        """Execute a git command in memory_dir via subprocess."""
+        """Execute a git command in memory_dir via subprocess.
+
+        Raises:
+            subprocess.CalledProcessError: If git exits with a non-zero status.
+        """
         git_bin = shutil.which("git") or "git"
         cmd = [git_bin, "-C", self.memory_dir, *args]
-        result = await asyncio.to_thread(
-            subprocess.run,
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
+        # Native asyncio subprocess: waits on the event loop, not a worker thread
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        return result.stdout
+        stdout_b, stderr_b = await proc.communicate()
+        stdout = stdout_b.decode(errors="replace")
+        if proc.returncode:
+            raise subprocess.CalledProcessError(
+                proc.returncode, cmd, stdout, stderr_b.decode(errors="replace")
+            )
+        return stdout
@@ -1,6 +1,7 @@
 """Core memory manager that orchestrates all memory operations."""
 
 import logging
+from itertools import chain
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from config import Config
@@ -194,6 +195,7 @@ class MemoryManager:
         # Track system messages separately
         if message.role == "system":
             self.system_messages.append(message)
+            self.current_tokens += self._count_tokens(message)
             return
 
         # Count tokens (use actual if provided, otherwise estimate)
@@ -208,24 +210,33 @@ class MemoryManager:
 
             # Log API usage separately
             logger.debug(
-                f"API usage: input={input_tokens}, output={output_tokens}, "
-                f"total={input_tokens + output_tokens}"
+                "API usage: input=%d, output=%d, total=%d",
+                input_tokens,
+                output_tokens,
+                input_tokens + output_tokens,
             )
         # Non-API messages (user, tool results) are not tracked here — their
         # tokens will be counted in the next API call's response.usage.input_tokens.
 
         # Add to short-term memory
-        self.short_term.add_message(message)
-
-        # Recalculate current tokens based on actual stored content
-        # This gives accurate count for compression decisions
-        self.current_tokens = self._recalculate_current_tokens()
+        evicted = self.short_term.add_message(message)
+
+        # Track stored content size incrementally for compression decisions;
+        # paths that drop or replace messages recount in full.
+        self.current_tokens += self._count_tokens(message)
+        if evicted is not None:
+            # Window was full (memory disabled or compression failed)
+            self.current_tokens -= self.token_tracker.release_message_tokens(
+                evicted, self.llm.provider_name.lower(), self.llm.model
+            )
 
         # Log memory state (stored content size, not API usage)
         logger.debug(
-            f"Memory state: {self.current_tokens} stored tokens, "
-            f"{self.short_term.count()}/{Config.MEMORY_SHORT_TERM_SIZE} messages, "
-            f"full={self.short_term.is_full()}"
+            "Memory state: %d stored tokens, %d/%d messages, full=%s",
+            self.current_tokens,
+            self.short_term.count(),
+            Config.MEMORY_SHORT_TERM_SIZE,
+            self.short_term.is_full(),
         )
 
         # Check if compression is needed
@@ -237,9 +248,10 @@ class MemoryManager:
         else:
             # Log compression check details
             logger.debug(
-                f"Compression check: stored={self.current_tokens}, "
-                f"threshold={Config.MEMORY_COMPRESSION_THRESHOLD}, "
-                f"short_term_full={self.short_term.is_full()}"
+                "Compression check: stored=%d, threshold=%d, short_term_full=%s",
+                self.current_tokens,
+                Config.MEMORY_COMPRESSION_THRESHOLD,
+                self.short_term.is_full(),
             )
 
     def get_context_for_llm(self) -> List[LLMMessage]:
@@ -254,7 +266,7 @@ class MemoryManager:
         context.extend(self.system_messages)
 
         # 2. Add short-term memory (includes summary messages and recent messages)
-        context.extend(self.short_term.get_messages())
+        context.extend(self.short_term.view())
 
         return context
 
@@ -324,12 +336,9 @@ class MemoryManager:
             self.token_tracker.add_compression_savings(compressed.token_savings)
             self.token_tracker.add_compression_cost(compressed.compressed_tokens)
 
-            # Remove compressed messages from short-term memory
-            self.short_term.remove_first(message_count)
-
-            # Get any remaining messages (added after compression started)
-            remaining_messages = self.short_term.get_messages()
-            self.short_term.clear()
+            # Remove compressed messages from short-term memory, keeping any
+            # remaining messages (added after compression started)
+            remaining_messages = self.short_term.clear()[message_count:]
 
             # Add compressed messages (summary + preserved, already combined by compressor)
             for msg in compressed.messages:
@@ -440,8 +449,22 @@ class MemoryManager:
         target = int(original_tokens * Config.MEMORY_COMPRESSION_RATIO)
         return max(target, 500)  # Minimum 500 tokens for summary
 
+    def _count_tokens(self, message: LLMMessage) -> int:
+        """Count tokens for a single stored message."""
+        return self.token_tracker.count_message_tokens(
+            message, self.llm.provider_name.lower(), self.llm.model
+        )
+
+    def recount_tokens(self) -> None:
+        """Recount current_tokens over all stored messages.
+
+        Call after the active provider/model changes, since the running
+        total was counted with the previous model's tokenizer.
+        """
+        self.current_tokens = self._recalculate_current_tokens()
+
     def _recalculate_current_tokens(self) -> int:
-        """Recalculate current token count from scratch.
+        """Recalculate current token count over all stored messages.
 
         Returns:
             Current token count
@@ -449,17 +472,11 @@ class MemoryManager:
         provider = self.llm.provider_name.lower()
         model = self.llm.model
 
-        total = 0
-
-        # Count system messages
-        for msg in self.system_messages:
-            total += self.token_tracker.count_message_tokens(msg, provider, model)
-
-        # Count short-term messages (includes summary messages)
-        for msg in self.short_term.get_messages():
-            total += self.token_tracker.count_message_tokens(msg, provider, model)
-
-        return total
+        # System messages plus short-term messages (includes summary messages).
+        # Only messages not seen before are actually tokenized.
+        return self.token_tracker.count_messages_tokens(
+            chain(self.system_messages, self.short_term.view()), provider, model
+        )
 
     def get_stats(self) -> Dict[str, Any]:
         """Get memory statistics.
@@ -501,9 +518,10 @@ class MemoryManager:
             logger.debug(f"Skipping save_memory: no messages to save for session {self.session_id}")
             return
 
+        # Pass snapshots: the store serializes them in a worker thread
         await self._store.save_memory(
             session_id=self.session_id,
-            system_messages=self.system_messages,
+            system_messages=list(self.system_messages),
             messages=messages,
         )
         logger.info(f"Saved memory state for session {self.session_id}")
@@ -527,7 +545,7 @@ class MemoryManager:
 
         This prevents API errors about missing tool responses on the next turn.
         """
-        messages = self.short_term.get_messages()
+        messages = self.short_term.view()
         if not messages:
             return
 
@@ -5,6 +5,7 @@ used by all persistence backends.
 """
 
 import json
+import sys
 from typing import Any, Dict
 
 from llm.message_types import LLMMessage
@@ -48,17 +49,14 @@ def serialize_message(message: LLMMessage) -> Dict[str, Any]:
     }
 
     # For assistant messages, always include tool_calls (even if None) for completeness
-    if message.role == "assistant":
-        result["tool_calls"] = (
-            message.tool_calls if (hasattr(message, "tool_calls") and message.tool_calls) else None
-        )
-    elif hasattr(message, "tool_calls") and message.tool_calls:
-        result["tool_calls"] = message.tool_calls
-
-    if hasattr(message, "tool_call_id") and message.tool_call_id:
+    tool_calls = message.tool_calls or None
+    if tool_calls is not None or message.role == "assistant":
+        result["tool_calls"] = tool_calls
+
+    if message.tool_call_id:
         result["tool_call_id"] = message.tool_call_id
 
-    if hasattr(message, "name") and message.name:
+    if message.name:
         result["name"] = message.name
 
     return result
@@ -73,10 +71,13 @@ def deserialize_message(data: Dict[str, Any]) -> LLMMessage:
     Returns:
         LLMMessage instance
     """
+    # Loaded sessions repeat a handful of roles and tool names thousands of
+    # times; intern them so every message shares one string object.
+    name = data.get("name")
     return LLMMessage(
-        role=data["role"],
+        role=sys.intern(data["role"]),
         content=data.get("content"),
         tool_calls=data.get("tool_calls"),
         tool_call_id=data.get("tool_call_id"),
-        name=data.get("name"),
+        name=sys.intern(name) if name else name,
     )
@@ -1,7 +1,7 @@
 """Short-term memory management with fixed-size window."""
 
 from collections import deque
-from typing import List
+from typing import List, Optional, Sequence
 
 from llm.base import LLMMessage
 
@@ -18,15 +18,20 @@ class ShortTermMemory:
         self.max_size = max_size
         self.messages = deque(maxlen=max_size)
 
-    def add_message(self, message: LLMMessage) -> None:
+    def add_message(self, message: LLMMessage) -> Optional[LLMMessage]:
         """Add a message to short-term memory.
 
         Automatically evicts oldest message if at capacity.
 
         Args:
             message: LLMMessage to add
+
+        Returns:
+            The evicted message, or None if nothing was evicted
         """
+        evicted = self.messages[0] if self.is_full() and self.messages else None
         self.messages.append(message)
+        return evicted
 
     def get_messages(self) -> List[LLMMessage]:
         """Get all messages in short-term memory.
@@ -36,6 +41,17 @@ class ShortTermMemory:
         """
         return list(self.messages)
 
+    def view(self) -> Sequence[LLMMessage]:
+        """Get a read-only view of the messages without copying.
+
+        The view reflects later changes; use get_messages() for a snapshot
+        that must stay stable across awaits.
+
+        Returns:
+            Messages, oldest to newest
+        """
+        return self.messages
+
     def clear(self) -> List[LLMMessage]:
         """Clear all messages and return them.
 
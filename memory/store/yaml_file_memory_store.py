@@ -9,9 +9,8 @@ import logging
 import os
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import aiofiles
 import aiofiles.os
 import yaml
 
@@ -22,10 +21,65 @@ from memory.serialization import (
 )
 from memory.store.memory_store import MemoryStore
 from utils.runtime import get_sessions_dir
+from utils.yaml_safe import SafeDumper, SafeLoader
 
 logger = logging.getLogger(__name__)
 
 
+# yaml.dump emits many small writes; a large buffer coalesces them into a few
+# write(2) calls for long sessions.
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# How far a session.yaml mtime may drift from the updated_at stamped just
+# before the write (slow serialization, coarse filesystem clocks) while mtime
+# order is still trusted for list_sessions.
+_MTIME_SLACK_NS = 60 * 1_000_000_000
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _isoformat_to_ns(value: Any) -> Optional[int]:
+    """Convert an ISO timestamp (naive means local time) to epoch nanoseconds."""
+    try:
+        return int(datetime.fromisoformat(value).timestamp() * 1_000_000_000)
+    except (TypeError, ValueError):
+        return None
+
+
+def _read_yaml_file(path: str) -> Any:
+    """Read and parse a YAML file, returning None if it does not exist.
+
+    The parser reads from the file in chunks, so a large session is never
+    held in memory as one string alongside the parsed result.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return yaml.load(f, Loader=SafeLoader)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _dump_yaml_file(path: str, data: Any, **dump_kwargs: Any) -> None:
+    """Atomically write YAML to path, streaming it straight into a temp file.
+
+    Emitting into the file avoids materializing the whole document as one
+    string first, which matters for long sessions. Missing parent
+    directories are created.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        yaml.dump(data, f, Dumper=SafeDumper, **dump_kwargs)
+    os.replace(tmp_path, path)
+
+
 class YamlFileMemoryStore(MemoryStore):
     """YAML file-based persistence backend.
 
@@ -42,6 +96,15 @@ class YamlFileMemoryStore(MemoryStore):
         self.sessions_dir = sessions_dir or get_sessions_dir()
         self._write_lock = asyncio.Lock()
         self._index: Optional[Dict[str, str]] = None  # UUID -> dir_name
+        # dir_name -> {(id(msg), include_tokens): (msg, serialized dict)} from the
+        # last save_memory.
+        # LLMMessages are never edited in place, and holding msg keeps its id
+        # from being reused while the entry exists.
+        self._serialized: Dict[str, Dict[Tuple[int, bool], Tuple[LLMMessage, Dict[str, Any]]]] = {}
+        # dir_name -> (session.yaml signature, top-level fields other than the
+        # message lists) as of our last save_memory, so the next save can skip
+        # re-parsing the whole file when nobody else has written it since.
+        self._session_headers: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
     async def _ensure_dir(self) -> None:
         """Ensure sessions directory exists."""
@@ -78,15 +141,14 @@ class YamlFileMemoryStore(MemoryStore):
         if self._index is not None:
             return self._index
 
-        index_path = self._index_path()
-        if await asyncio.to_thread(os.path.exists, index_path):
-            try:
-                async with aiofiles.open(index_path, encoding="utf-8") as f:
-                    content = await f.read()
-                self._index = yaml.safe_load(content) or {}
-                return self._index
-            except Exception:
-                logger.warning("Failed to load index, rebuilding")
+        try:
+            index = await asyncio.to_thread(_read_yaml_file, self._index_path())
+        except Exception:
+            index = None
+            logger.warning("Failed to load index, rebuilding")
+        if index is not None:
+            self._index = index or {}
+            return self._index
 
         # Rebuild index by scanning directories
         self._index = await self._rebuild_index()
@@ -107,13 +169,8 @@ class YamlFileMemoryStore(MemoryStore):
         for entry in entries:
             if entry.startswith("."):
                 continue
-            yaml_path = self._session_yaml_path(entry)
-            if not await asyncio.to_thread(os.path.exists, yaml_path):
-                continue
             try:
-                async with aiofiles.open(yaml_path, encoding="utf-8") as f:
-                    content = await f.read()
-                data = yaml.safe_load(content)
+                data = await asyncio.to_thread(_read_yaml_file, self._session_yaml_path(entry))
                 if data and "id" in data:
                     index[data["id"]] = entry
             except Exception:
@@ -125,12 +182,13 @@ class YamlFileMemoryStore(MemoryStore):
 
     async def _save_index(self, index: Dict[str, str]) -> None:
         """Save index to disk."""
-        index_path = self._index_path()
-        tmp_path = index_path + ".tmp"
-        content = yaml.dump(index, default_flow_style=False, allow_unicode=True)
-        async with aiofiles.open(tmp_path, "w", encoding="utf-8") as f:
-            await f.write(content)
-        await asyncio.to_thread(os.replace, tmp_path, index_path)
+        await asyncio.to_thread(
+            _dump_yaml_file,
+            self._index_path(),
+            index,
+            default_flow_style=False,
+            allow_unicode=True,
+        )
 
     async def _load_session_data(self, dir_name: str) -> Optional[Dict[str, Any]]:
         """Load raw YAML data from a session directory.
@@ -141,12 +199,7 @@ class YamlFileMemoryStore(MemoryStore):
         Returns:
             Parsed YAML data or None
         """
-        yaml_path = self._session_yaml_path(dir_name)
-        if not await asyncio.to_thread(os.path.exists, yaml_path):
-            return None
-        async with aiofiles.open(yaml_path, encoding="utf-8") as f:
-            content = await f.read()
-        return yaml.safe_load(content)
+        return await asyncio.to_thread(_read_yaml_file, self._session_yaml_path(dir_name))
 
     async def _save_session_data(self, dir_name: str, data: Dict[str, Any]) -> None:
         """Atomically write session data to YAML file.
@@ -155,22 +208,18 @@ class YamlFileMemoryStore(MemoryStore):
             dir_name: Session directory name
             data: Session data to write
         """
-        session_dir = os.path.join(self.sessions_dir, dir_name)
-        await aiofiles.os.makedirs(session_dir, exist_ok=True)
-
-        yaml_path = self._session_yaml_path(dir_name)
-        tmp_path = yaml_path + ".tmp"
+        await asyncio.to_thread(self._write_session_data, dir_name, data)
 
-        content = yaml.dump(
+    def _write_session_data(self, dir_name: str, data: Dict[str, Any]) -> None:
+        """Blocking body of _save_session_data; runs in a worker thread."""
+        _dump_yaml_file(
+            self._session_yaml_path(dir_name),
             data,
             default_flow_style=False,
             allow_unicode=True,
             sort_keys=False,
             width=120,
         )
-        async with aiofiles.open(tmp_path, "w", encoding="utf-8") as f:
-            await f.write(content)
-        await asyncio.to_thread(os.replace, tmp_path, yaml_path)
 
     async def _resolve_session_dir(self, session_id: str) -> Optional[str]:
         """Resolve a session ID to its directory name.
@@ -254,37 +303,97 @@ class YamlFileMemoryStore(MemoryStore):
             return
 
         async with self._write_lock:
-            data = await self._load_session_data(dir_name)
-            if not data:
+            # Reading, serializing and writing all happen in one worker thread;
+            # serializing thousands of messages is CPU-bound.
+            saved = await asyncio.to_thread(
+                self._write_memory,
+                dir_name,
+                datetime.now().isoformat(),
+                system_messages,
+                messages,
+            )
+            if not saved:
                 logger.warning(f"Session {session_id} not found")
                 return
 
-            data["system_messages"] = [serialize_message(msg) for msg in system_messages]
-
-            messages_list = []
-            for msg in messages:
-                msg_data = serialize_message(msg)
-                msg_data["tokens"] = 0
-                messages_list.append(msg_data)
-            data["messages"] = messages_list
-
-            data["updated_at"] = datetime.now().isoformat()
-
-            await self._save_session_data(dir_name, data)
-
         logger.debug(
             f"Saved memory for session {session_id}: "
             f"{len(system_messages)} system msgs, "
             f"{len(messages)} messages"
         )
 
+    def _read_session_header(self, dir_name: str) -> Optional[Dict[str, Any]]:
+        """Return a session's top-level fields other than its message lists.
+
+        Uses the copy cached by the last save_memory while session.yaml is
+        unchanged since; otherwise parses the file.
+        """
+        path = self._session_yaml_path(dir_name)
+        cached = self._session_headers.get(dir_name)
+        if cached is not None and cached[0] == _file_signature(path):
+            return dict(cached[1])
+
+        data = _read_yaml_file(path)
+        if not data:
+            return None
+        return {k: v for k, v in data.items() if k not in ("system_messages", "messages")}
+
+    def _write_memory(
+        self,
+        dir_name: str,
+        updated_at: str,
+        system_messages: List[LLMMessage],
+        messages: List[LLMMessage],
+    ) -> bool:
+        """Replace a session's messages on disk; runs in a worker thread.
+
+        Returns:
+            False if the session file does not exist
+        """
+        data = self._read_session_header(dir_name)
+        if data is None:
+            return False
+        data["updated_at"] = updated_at
+        header = dict(data)
+
+        previous = self._serialized.get(dir_name, {})
+        current: Dict[Tuple[int, bool], Tuple[LLMMessage, Dict[str, Any]]] = {}
+
+        def serialize(msg: LLMMessage, include_tokens: bool) -> Dict[str, Any]:
+            key = (id(msg), include_tokens)
+            entry = previous.get(key)
+            if entry is None or entry[0] is not msg:
+                msg_data = serialize_message(msg)
+                if include_tokens:
+                    msg_data["tokens"] = 0
+                entry = (msg, msg_data)
+            current[key] = entry
+            return entry[1]
+
+        data["system_messages"] = [serialize(msg, include_tokens=False) for msg in system_messages]
+        data["messages"] = [serialize(msg, include_tokens=True) for msg in messages]
+
+        self._write_session_data(dir_name, data)
+        # Rebuilt on every save so only messages still in memory are retained
+        self._serialized[dir_name] = current
+        signature = _file_signature(self._session_yaml_path(dir_name))
+        if signature is not None:
+            self._session_headers[dir_name] = (signature, header)
+        return True
+
     async def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         dir_name = await self._resolve_session_dir(session_id)
         if not dir_name:
             logger.warning(f"Session {session_id} not found")
             return None
 
-        data = await self._load_session_data(dir_name)
+        # Parsing and rebuilding every message is CPU-bound; keep both off the
+        # event loop in a single worker-thread hop.
+        return await asyncio.to_thread(self._read_session, dir_name)
+
+    def _read_session(self, dir_name: str) -> Optional[Dict[str, Any]]:
+        """Blocking body of load_session; runs in a worker thread."""
+        data = _read_yaml_file(self._session_yaml_path(dir_name))
         if not data:
             return None
 
@@ -304,8 +413,26 @@ class YamlFileMemoryStore(MemoryStore):
         await self._ensure_dir()
         index = await self._load_index()
 
+        wanted = offset + limit
+        if wanted <= 0:
+            return []
+
+        # Every save rewrites session.yaml right after stamping updated_at, so
+        # file mtimes track updated_at. Read sessions newest-mtime first and
+        # stop once `wanted` valid ones are found and the remaining mtimes are
+        # too old for their updated_at to compete. A parsed session whose mtime
+        # strays from its updated_at (copied, restored, touched) means mtime
+        # order can't be trusted, so every session is read instead.
+        candidates = await asyncio.to_thread(self._stat_sessions, index)
+        candidates.sort(reverse=True)
+
         sessions = []
-        for session_id, dir_name in index.items():
+        full_scan = False
+        cutoff = None
+        for mtime, session_id, dir_name in candidates:
+            if not full_scan and cutoff is not None and mtime < cutoff:
+                break
+
             data = await self._load_session_data(dir_name)
             if not data:
                 continue
@@ -331,11 +458,28 @@ class YamlFileMemoryStore(MemoryStore):
                 }
             )
 
+            updated_ns = _isoformat_to_ns(data.get("updated_at"))
+            if updated_ns is None or abs(mtime - updated_ns) > _MTIME_SLACK_NS:
+                full_scan = True
+            elif len(sessions) == wanted:
+                cutoff = mtime - 2 * _MTIME_SLACK_NS
+
         # Sort by updated_at descending
         sessions.sort(key=lambda s: s.get("updated_at", ""), reverse=True)
 
         return sessions[offset : offset + limit]
 
+    def _stat_sessions(self, index: Dict[str, str]) -> List[Tuple[int, str, str]]:
+        """Return (mtime_ns, session_id, dir_name) for sessions whose file exists."""
+        stamped = []
+        for session_id, dir_name in index.items():
+            try:
+                mtime = os.stat(self._session_yaml_path(dir_name)).st_mtime_ns
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            stamped.append((mtime, session_id, dir_name))
+        return stamped
+
     async def delete_session(self, session_id: str) -> bool:
         dir_name = await self._resolve_session_dir(session_id)
         if not dir_name:
@@ -351,6 +495,8 @@ class YamlFileMemoryStore(MemoryStore):
                     entry_path = os.path.join(session_dir, entry)
                     await aiofiles.os.remove(entry_path)
                 await asyncio.to_thread(os.rmdir, session_dir)
+            self._serialized.pop(dir_name, None)
+            self._session_headers.pop(dir_name, None)
 
             # Update index
             index = await self._load_index()
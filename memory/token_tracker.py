@@ -1,7 +1,8 @@
 """Token counting and cost tracking for memory management."""
 
 import logging
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Iterable, Tuple
 
 from llm.content_utils import extract_text
 from llm.message_types import LLMMessage
@@ -10,6 +11,18 @@ from utils.model_pricing import MODEL_PRICING
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _get_tiktoken_encoding(model: str):
+    """Return the tiktoken encoding for a model, resolved once per model."""
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Fallback to cl100k_base for unknown models
+        return tiktoken.get_encoding("cl100k_base")
+
+
 class TokenTracker:
     """Tracks token usage and costs across conversations."""
 
@@ -22,10 +35,16 @@ class TokenTracker:
         self.total_output_tokens = 0
         self.compression_savings = 0  # Tokens saved through compression
         self.compression_cost = 0  # Tokens spent on compression
+        # id(message) -> (message, provider, model, tokens). LLMMessages are not
+        # edited in place, and holding the message keeps its id from being reused.
+        self._message_tokens: Dict[int, Tuple[LLMMessage, str, str, int]] = {}
 
     def count_message_tokens(self, message: LLMMessage, provider: str, model: str) -> int:
         """Count tokens in a message.
 
+        Counts are cached per message object, so each message is tokenized once
+        per provider/model.
+
         Args:
             message: LLMMessage to count tokens for
             provider: LLM provider name ("openai", "anthropic", "gemini")
@@ -34,6 +53,60 @@ class TokenTracker:
         Returns:
             Token count
         """
+        cached = self._message_tokens.get(id(message))
+        if (
+            cached is not None
+            and cached[0] is message
+            and cached[1] == provider
+            and cached[2] == model
+        ):
+            return cached[3]
+
+        tokens = self._count_tokens(message, provider, model)
+        self._message_tokens[id(message)] = (message, provider, model, tokens)
+        return tokens
+
+    def release_message_tokens(self, message: LLMMessage, provider: str, model: str) -> int:
+        """Count tokens in a message that is leaving memory and drop its cache entry.
+
+        Args:
+            message: LLMMessage being removed
+            provider: LLM provider name
+            model: Model identifier
+
+        Returns:
+            Token count
+        """
+        tokens = self.count_message_tokens(message, provider, model)
+        del self._message_tokens[id(message)]
+        return tokens
+
+    def count_messages_tokens(
+        self, messages: Iterable[LLMMessage], provider: str, model: str
+    ) -> int:
+        """Count total tokens in messages.
+
+        Cached counts are kept only for these messages, so messages dropped
+        from memory are released.
+
+        Args:
+            messages: Messages to count tokens for
+            provider: LLM provider name
+            model: Model identifier
+
+        Returns:
+            Total token count
+        """
+        total = 0
+        live: Dict[int, Tuple[LLMMessage, str, str, int]] = {}
+        for message in messages:
+            total += self.count_message_tokens(message, provider, model)
+            live[id(message)] = self._message_tokens[id(message)]
+        self._message_tokens = live
+        return total
+
+    def _count_tokens(self, message: LLMMessage, provider: str, model: str) -> int:
+        """Count tokens in a message without consulting the cache."""
         content = self._extract_content(message)
 
         if provider == "openai":
@@ -63,15 +136,7 @@ class TokenTracker:
     def _count_openai_tokens(self, text: str, model: str) -> int:
         """Count tokens using tiktoken for OpenAI models."""
         try:
-            import tiktoken
-
-            try:
-                encoding = tiktoken.encoding_for_model(model)
-            except KeyError:
-                # Fallback to cl100k_base for unknown models
-                encoding = tiktoken.get_encoding("cl100k_base")
-
-            return len(encoding.encode(text))
+            return len(_get_tiktoken_encoding(model).encode(text))
         except ImportError:
             logger.warning("tiktoken not installed, using fallback estimation")
             return len(text) // 4
@@ -201,3 +266,4 @@ class TokenTracker:
         self.total_output_tokens = 0
         self.compression_savings = 0
         self.compression_cost = 0
+        self._message_tokens.clear()
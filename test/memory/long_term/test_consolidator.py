@@ -80,3 +80,19 @@ class TestConsolidator:
         memories = {cat: "" for cat in MemoryCategory}
         text = consolidator._format_memories_text(memories)
         assert text == "(empty)"
+
+    async def test_memories_text_length_matches_formatted_text(self, mock_ltm_llm):
+        consolidator = LongTermMemoryConsolidator(mock_ltm_llm)
+        cases = [
+            {cat: "" for cat in MemoryCategory},
+            {MemoryCategory.FACTS: "  - only facts\n"},
+            {
+                MemoryCategory.DECISIONS: "- use uv\n- 中文\n",
+                MemoryCategory.PREFERENCES: "   ",
+                MemoryCategory.FACTS: "\n- fact\n\n",
+            },
+        ]
+        for memories in cases:
+            assert consolidator._memories_text_length(memories) == len(
+                consolidator._format_memories_text(memories)
+            )
@@ -1,10 +1,20 @@
 """Tests for GitMemoryStore."""
 
+import os
+import subprocess
+
 import pytest
 
 from memory.long_term.store import GitMemoryStore, MemoryCategory
 
 
+def _install_rejecting_hook(memory_dir: str) -> None:
+    hook = os.path.join(memory_dir, ".git", "hooks", "pre-commit")
+    with open(hook, "w") as f:
+        f.write("#!/bin/sh\necho 'rejected by hook' >&2\nexit 1\n")
+    os.chmod(hook, 0o755)
+
+
 @pytest.mark.asyncio
 class TestGitMemoryStore:
     async def test_ensure_repo_creates_git_dir(self, tmp_path):
@@ -84,3 +94,12 @@ class TestGitMemoryStore:
         await git_store.save_and_commit(memories, "test")
         loaded = await git_store.load_all()
         assert loaded[MemoryCategory.DECISIONS] == content
+
+    async def test_commit_failure_surfaces_commit_error(self, git_store, sample_memories):
+        """A rejected commit raises the commit's error, not the staged-diff check's."""
+        _install_rejecting_hook(git_store.memory_dir)
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            await git_store.save_and_commit(sample_memories, "blocked")
+        assert "commit" in exc_info.value.cmd
+        assert "rejected by hook" in exc_info.value.stderr
@@ -369,7 +369,7 @@ class TestMessageSeparation:
         Regression test: an assistant message at index N has 5 tool_calls with
         responses at N+1..N+5.  If only N+3..N+5 fall inside the recent window,
         a single-pass pair check would skip [N, N+1] and [N, N+2] because N is
-        not yet marked when those pairs are visited.  The fixed-point loop must
+        not yet marked when those pairs are visited.  The pair closure must
         pull N+1 and N+2 into the preserved set.
         """
         # Use MIN_SIZE=3 so only the last 3 messages are initially preserved.
@@ -389,6 +389,72 @@ class TestEdgeCases:
         assert stats["total_input_tokens"] >= 100
         assert stats["total_output_tokens"] >= 50
 
+    async def test_messages_tokenized_once(self, mock_llm, monkeypatch):
+        """Recounting reuses cached per-message token counts."""
+        manager = MemoryManager(mock_llm)
+        counted = []
+        original = manager.token_tracker._count_tokens
+
+        def tracking_count(message, provider, model):
+            counted.append(message)
+            return original(message, provider, model)
+
+        monkeypatch.setattr(manager.token_tracker, "_count_tokens", tracking_count)
+
+        messages = [LLMMessage(role="user", content=f"Message {i}") for i in range(3)]
+        for msg in messages:
+            await manager.add_message(msg)
+        assert counted == messages
+
+        # Full recounts (as after compression or rollback) hit the cache
+        total = manager._recalculate_current_tokens()
+        manager._recalculate_current_tokens()
+
+        assert counted == messages
+        assert total == sum(original(m, "mock", "mock-model") for m in messages)
+
+    async def test_model_switch_recounts_tokens(self, mock_llm):
+        """Switching the agent's LLM recounts stored tokens with the new model."""
+        from agent.base import BaseAgent
+
+        class _ConcreteAgent(BaseAgent):
+            async def run(self, task: str) -> str:
+                raise NotImplementedError
+
+        agent = object.__new__(_ConcreteAgent)
+        agent.memory = MemoryManager(mock_llm)
+        await agent.memory.add_message(LLMMessage(role="user", content="x" * 70))
+        assert agent.memory.current_tokens == 70 // 4
+
+        agent._set_llm_adapter(type(mock_llm)(provider="anthropic", model="claude"))
+
+        assert agent.memory.current_tokens == int(70 / 3.5)
+
+    async def test_evicted_messages_leave_token_total(self, set_memory_config, mock_llm):
+        """Messages the short-term window evicts are subtracted from the total."""
+        set_memory_config(MEMORY_ENABLED=False, MEMORY_SHORT_TERM_SIZE=3)
+        manager = MemoryManager(mock_llm)
+
+        for i in range(10):
+            await manager.add_message(LLMMessage(role="user", content=f"Message {i:03d}" * 4))
+
+        assert manager.short_term.count() == 3
+        # Evicted messages are released from the token cache too
+        assert len(manager.token_tracker._message_tokens) == 3
+        assert manager.current_tokens == manager._recalculate_current_tokens()
+
+    async def test_incremental_tokens_match_full_recount(self, mock_llm):
+        """Running token total includes system messages and matches a recount."""
+        manager = MemoryManager(mock_llm)
+
+        await manager.add_message(LLMMessage(role="system", content="You are helpful " * 10))
+        assert manager.current_tokens > 0
+
+        await manager.add_message(LLMMessage(role="user", content="Hello there"))
+        await manager.add_message(LLMMessage(role="assistant", content="Hi! " * 20))
+
+        assert manager.current_tokens == manager._recalculate_current_tokens()
+
     async def test_non_api_messages_do_not_accumulate_tokens(self, mock_llm):
         """Non-API messages should not increase total_input/output_tokens.
 
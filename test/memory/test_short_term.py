@@ -73,6 +73,20 @@ class TestShortTermMemoryBasics:
         messages = stm.get_messages()
         assert messages == [msg1, msg2, msg3]
 
+    def test_view_reflects_messages_without_copying(self):
+        """Test that view returns the live messages in order."""
+        stm = ShortTermMemory(max_size=5)
+
+        msg1 = LLMMessage(role="user", content="First")
+        msg2 = LLMMessage(role="assistant", content="Second")
+        stm.add_message(msg1)
+
+        view = stm.view()
+        stm.add_message(msg2)
+
+        assert list(view) == [msg1, msg2]
+        assert view is stm.view()
+
 
 class TestShortTermMemoryCapacity:
     """Test capacity management."""
@@ -102,6 +116,15 @@ class TestShortTermMemoryCapacity:
         assert stm.is_full()
         assert stm.count() == 3  # Should stay at max_size
 
+    def test_add_message_returns_evicted(self):
+        """Test add_message reports the message it evicted."""
+        stm = ShortTermMemory(max_size=2)
+
+        first = LLMMessage(role="user", content="First")
+        assert stm.add_message(first) is None
+        assert stm.add_message(LLMMessage(role="user", content="Second")) is None
+        assert stm.add_message(LLMMessage(role="user", content="Third")) is first
+
     def test_automatic_eviction_on_overflow(self):
         """Test that oldest messages are automatically evicted."""
         stm = ShortTermMemory(max_size=3)
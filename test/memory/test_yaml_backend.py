@@ -2,8 +2,10 @@
 
 import os
 import tempfile
+from datetime import datetime, timedelta
 
 import pytest
+import yaml
 
 from llm.message_types import LLMMessage
 from memory.store import YamlFileMemoryStore
@@ -23,6 +25,22 @@ def store(temp_sessions_dir):
     return YamlFileMemoryStore(sessions_dir=temp_sessions_dir)
 
 
+def _stamp_session(store, dir_name, age_hours):
+    """Rewrite a session as last saved `age_hours` before a fixed time."""
+    when = datetime(2024, 1, 1, 12) - timedelta(hours=age_hours)
+    path = store._session_yaml_path(dir_name)
+    with open(path, encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    data["updated_at"] = when.isoformat()
+    store._write_session_data(dir_name, data)
+    os.utime(path, (when.timestamp(), when.timestamp()))
+
+
+def _truncate_session(store, dir_name):
+    with open(store._session_yaml_path(dir_name), "w"):
+        pass
+
+
 class TestYamlBackendBasics:
     """Test basic YamlFileMemoryStore functionality."""
 
@@ -217,6 +235,64 @@ class TestBatchSave:
         assert session_data["system_messages"][0].content == "Second"
         assert session_data["messages"][0].content == "Message 2"
 
+    async def test_save_memory_reserializes_only_new_messages(self, store, monkeypatch):
+        """Messages unchanged since the last save reuse their serialized form."""
+        from memory.store import yaml_file_memory_store
+
+        session_id = await store.create_session()
+        system = [LLMMessage(role="system", content="System")]
+        messages = [LLMMessage(role="user", content="Message 1")]
+        await store.save_memory(session_id, system, messages)
+
+        serialized = []
+        original = yaml_file_memory_store.serialize_message
+
+        def tracking_serialize(msg):
+            serialized.append(msg)
+            return original(msg)
+
+        monkeypatch.setattr(yaml_file_memory_store, "serialize_message", tracking_serialize)
+
+        new_message = LLMMessage(role="assistant", content="Reply")
+        await store.save_memory(session_id, system, messages + [new_message])
+        assert serialized == [new_message]
+
+        session_data = await store.load_session(session_id)
+        assert [m.content for m in session_data["messages"]] == ["Message 1", "Reply"]
+        assert session_data["system_messages"][0].content == "System"
+
+    async def test_save_memory_reuses_header_until_file_changes(self, store, monkeypatch):
+        """Repeated saves skip re-parsing session.yaml unless it changed on disk."""
+        from memory.store import yaml_file_memory_store
+
+        session_id = await store.create_session()
+        messages = [LLMMessage(role="user", content="Hello")]
+        await store.save_memory(session_id, [], messages)
+
+        reads = []
+        original = yaml_file_memory_store._read_yaml_file
+
+        def tracking_read(path):
+            reads.append(path)
+            return original(path)
+
+        monkeypatch.setattr(yaml_file_memory_store, "_read_yaml_file", tracking_read)
+
+        await store.save_memory(session_id, [], messages)
+        assert reads == []
+
+        await store.save_message(session_id, LLMMessage(role="user", content="External"))
+        reads.clear()
+        await store.save_memory(session_id, [], messages)
+        assert len(reads) == 1
+
+        monkeypatch.setattr(yaml_file_memory_store, "_read_yaml_file", original)
+        index = await store._load_index()
+        data = await store._load_session_data(index[session_id])
+        assert data["id"] == session_id
+        assert list(data) == ["id", "created_at", "updated_at", "system_messages", "messages"]
+        assert [m["content"] for m in data["messages"]] == ["Hello"]
+
 
 class TestSessionRetrieval:
     """Test session retrieval and listing."""
@@ -241,6 +317,48 @@ class TestSessionRetrieval:
         sessions = await store.list_sessions(limit=5)
         assert len(sessions) == 5
 
+    async def test_list_sessions_limit_only_parses_newest(self, store, monkeypatch):
+        """With a limit, only the most recently written sessions are parsed."""
+        session_ids = [await store.create_session() for _ in range(4)]
+        index = await store._load_index()
+        for age, sid in enumerate(reversed(session_ids)):
+            _stamp_session(store, index[sid], age_hours=age)
+
+        loaded = []
+        original = store._load_session_data
+
+        async def tracking_load(dir_name):
+            loaded.append(dir_name)
+            return await original(dir_name)
+
+        monkeypatch.setattr(store, "_load_session_data", tracking_load)
+
+        sessions = await store.list_sessions(limit=2)
+        assert len(sessions) == 2
+        assert loaded == [index[session_ids[3]], index[session_ids[2]]]
+
+    async def test_list_sessions_touched_file_falls_back_to_full_scan(self, store):
+        """A session whose mtime no longer tracks updated_at can't hide newer ones."""
+        session_ids = [await store.create_session() for _ in range(3)]
+        index = await store._load_index()
+        for age, sid in enumerate(reversed(session_ids)):
+            _stamp_session(store, index[sid], age_hours=age)
+        # Touch the oldest session so its mtime is newest
+        os.utime(store._session_yaml_path(index[session_ids[0]]))
+
+        assert await store.find_latest_session() == session_ids[2]
+
+    async def test_list_sessions_skips_unreadable_and_fills_limit(self, store):
+        """Empty session files don't shrink the result below the limit."""
+        session_ids = [await store.create_session() for _ in range(4)]
+        index = await store._load_index()
+        for age, sid in enumerate(reversed(session_ids)):
+            _stamp_session(store, index[sid], age_hours=age)
+        _truncate_session(store, index[session_ids[3]])  # newest mtime, but empty
+
+        sessions = await store.list_sessions(limit=2)
+        assert [s["id"] for s in sessions] == [session_ids[2], session_ids[1]]
+
     async def test_load_nonexistent_session(self, store):
         """Test loading a session that doesn't exist."""
         result = await store.load_session("nonexistent-id")
@@ -179,3 +179,26 @@ async def test_handle_login_syncs_models(monkeypatch):
 
     assert any("Added 1 chatgpt models" in line for line in console.lines)
     assert infos and infos[-1] == "Run /model to pick the active model."
+
+
+async def test_handle_command_dispatches_login_with_parts(monkeypatch):
+    session = _make_session(monkeypatch)
+    seen = []
+
+    async def fake_login(command_parts):
+        seen.append(command_parts)
+
+    monkeypatch.setattr(session, "_handle_login_command", fake_login)
+
+    assert await session._handle_command("/LOGIN extra") is True
+    assert seen == [["/LOGIN", "extra"]]
+
+
+async def test_handle_command_unknown_and_exit(monkeypatch):
+    session = _make_session(monkeypatch)
+    console = _DummyConsole()
+    monkeypatch.setattr(interactive.terminal_ui, "console", console)
+
+    assert await session._handle_command("/nope") is True
+    assert any("Unknown command: /nope" in line for line in console.lines)
+    assert await session._handle_command("/quit") is False
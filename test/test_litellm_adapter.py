@@ -202,3 +202,13 @@ class TestToolConversion:
         assert result[0]["function"]["name"] == "read_file"
         assert result[0]["function"]["description"] == "Read a file"
         assert result[0]["function"]["parameters"] == tools[0]["input_schema"]
+
+    def test_convert_tools_reuses_result_for_same_list(self):
+        """The same tools list is converted once and reused."""
+        tools = [{"name": "glob", "description": "Find files", "input_schema": {}}]
+
+        first = self.adapter._convert_tools(tools)
+        assert self.adapter._convert_tools(tools) is first
+
+        other = [dict(tools[0], name="grep")]
+        assert self.adapter._convert_tools(other)[0]["function"]["name"] == "grep"
@@ -72,3 +72,14 @@ async def test_model_setup_does_not_treat_normal_text_as_model_id(tmp_path, monk
     ready = await session.run()
     assert ready is False
     assert any(title == "Model Setup" for title, _ in errors)
+
+
+def test_split_command_args_plain_and_quoted():
+    import pytest
+
+    from utils.tui.model_ui import split_command_args
+
+    assert split_command_args("/model  openai/gpt-4o") == ["/model", "openai/gpt-4o"]
+    assert split_command_args('/model "my model"') == ["/model", "my model"]
+    with pytest.raises(ValueError):
+        split_command_args('/model "unterminated')
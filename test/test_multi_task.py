@@ -105,6 +105,29 @@ class TestMultiTaskTool:
         result = await tool.execute(tasks=tasks, dependencies=dependencies)
         assert "circular" in result.lower() or "cycle" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_execute_with_dependencies_respects_order(self):
+        agent = MagicMock()
+        tool = MultiTaskTool(agent)
+        tool.MAX_PARALLEL = 2
+        batches = []
+
+        async def fake_batch(batch, tasks, tools, previous_results):
+            for idx in batch:
+                deps = dependencies.get(str(idx), [])
+                assert all(int(d) in previous_results for d in deps)
+            batches.append(list(batch))
+            return {idx: f"done {idx}" for idx in batch}
+
+        tool._execute_batch = fake_batch
+        tasks = ["a", "b", "c", "d", "e"]
+        dependencies = {"2": ["0", "1", "1"], "3": ["2"], "4": ["0"]}
+        results = await tool._execute_with_dependencies(tasks, dependencies, [])
+
+        assert set(results) == {0, 1, 2, 3, 4}
+        assert batches[0] == [0, 1]
+        assert all(len(batch) <= 2 for batch in batches)
+
     # ------------------------------------------------------------------
     # Result formatting
     # ------------------------------------------------------------------
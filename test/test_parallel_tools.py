@@ -147,6 +147,15 @@ def test_is_tool_readonly_unknown_tool():
     assert executor.is_tool_readonly("nonexistent") is False
 
 
+def test_tool_schemas_cached_until_tool_added():
+    executor = ToolExecutor([ReadonlyStubTool("read_file")])
+    schemas = executor.get_tool_schemas()
+    assert executor.get_tool_schemas() is schemas
+
+    executor.add_tool(WritableStubTool("write_file"))
+    assert [s["name"] for s in executor.get_tool_schemas()] == ["read_file", "write_file"]
+
+
 # ---------------------------------------------------------------------------
 # Parallel vs sequential dispatch
 # ---------------------------------------------------------------------------
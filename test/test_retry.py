@@ -0,0 +1,98 @@
+"""Tests for LLM retry error classification."""
+
+import asyncio
+import logging
+
+import pytest
+
+from config import Config
+from llm.retry import get_retry_after, is_rate_limit_error, is_retryable_error, with_retry
+
+
+class RateLimitError(Exception):
+    pass
+
+
+@pytest.mark.parametrize(
+    ("error", "rate_limited", "retryable"),
+    [
+        (Exception("HTTP 429 from upstream"), True, True),
+        (Exception("Rate Limit exceeded"), True, True),
+        (Exception("ResourceExhausted: quota"), True, True),
+        (Exception("Internal Server Error"), False, True),
+        (TimeoutError("Read TIMEOUT"), False, True),
+        (RateLimitError("slow down"), False, True),
+        (ValueError("invalid request"), False, False),
+        (asyncio.CancelledError("timeout"), False, False),
+    ],
+)
+def test_error_classification(error, rate_limited, retryable):
+    assert is_rate_limit_error(error) is rate_limited
+    assert is_retryable_error(error) is retryable
+
+
+class _Response:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class _HttpError(Exception):
+    def __init__(self, message, headers=None):
+        super().__init__(message)
+        self.response = _Response(headers or {})
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (_HttpError("429", {"retry-after": "12"}), 12.0),
+        (_HttpError("429", {"Retry-After": "1.5"}), 1.5),
+        (Exception('quota exceeded, "retryDelay": "20s"'), 20.0),
+        (Exception("Please retry in 7.5s."), 7.5),
+        (Exception("429 Too Many Requests"), None),
+    ],
+)
+def test_get_retry_after(error, expected):
+    assert get_retry_after(error) == expected
+
+
+async def test_retry_waits_at_least_retry_after(monkeypatch):
+    monkeypatch.setattr(Config, "RETRY_MAX_ATTEMPTS", 1)
+    monkeypatch.setattr(Config, "RETRY_MAX_DELAY", 30.0)
+    monkeypatch.setattr(Config, "get_retry_delay", classmethod(lambda cls, attempt: 0.5))
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    calls = []
+
+    @with_retry()
+    async def limited():
+        calls.append(1)
+        if len(calls) == 1:
+            raise _HttpError("429 Too Many Requests", {"retry-after": "120"})
+        return "ok"
+
+    assert await limited() == "ok"
+    assert slept == [30.0]
+
+
+async def test_retry_logs_the_delay_it_sleeps(monkeypatch, caplog):
+    monkeypatch.setattr(Config, "RETRY_MAX_ATTEMPTS", 1)
+    delays = iter([0.01, 5.0])
+    monkeypatch.setattr(Config, "get_retry_delay", classmethod(lambda cls, attempt: next(delays)))
+    calls = []
+
+    @with_retry()
+    async def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise Exception("503 Service Unavailable")
+        return "ok"
+
+    with caplog.at_level(logging.WARNING):
+        assert await flaky() == "ok"
+
+    assert "Retrying in 0.0s" in caplog.text
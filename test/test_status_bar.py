@@ -0,0 +1,70 @@
+"""Tests for the TUI status bar."""
+
+import io
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from rich.console import Console
+
+from config import Config
+from interactive import InteractiveSession
+from utils.tui.status_bar import StatusBar
+
+
+def _make_bar() -> StatusBar:
+    return StatusBar(Console(file=io.StringIO()))
+
+
+def test_update_sets_only_provided_fields():
+    bar = _make_bar()
+    bar.update(input_tokens=10, model_name="gpt")
+    bar.update(output_tokens=5)
+
+    assert bar.state.input_tokens == 10
+    assert bar.state.output_tokens == 5
+    assert bar.state.model_name == "gpt"
+
+
+def _make_session(stats: dict) -> InteractiveSession:
+    session = object.__new__(InteractiveSession)
+    session.agent = SimpleNamespace(
+        memory=SimpleNamespace(get_stats=lambda: dict(stats)),
+        get_current_model_info=lambda: {"name": "gpt"},
+    )
+    session.status_bar = MagicMock()
+    session._last_stats_sig = None
+    return session
+
+
+def test_update_status_bar_skips_unchanged_stats(monkeypatch):
+    monkeypatch.setattr(Config, "TUI_STATUS_BAR", True)
+    stats = {"total_input_tokens": 10, "total_output_tokens": 5, "current_tokens": 7}
+    session = _make_session(stats)
+
+    session._update_status_bar()
+    session._update_status_bar()
+    assert session.status_bar.update.call_count == 1
+
+    stats["current_tokens"] = 8
+    session._update_status_bar()
+    assert session.status_bar.update.call_count == 2
+
+
+def test_update_status_bar_always_applies_processing_flag(monkeypatch):
+    monkeypatch.setattr(Config, "TUI_STATUS_BAR", True)
+    session = _make_session({})
+
+    session._update_status_bar()
+    session._update_status_bar(is_processing=False)
+
+    assert session.status_bar.update.call_count == 2
+    assert session.status_bar.update.call_args.kwargs["is_processing"] is False
+
+
+def test_update_status_bar_disabled(monkeypatch):
+    monkeypatch.setattr(Config, "TUI_STATUS_BAR", False)
+    session = _make_session({})
+
+    session._update_status_bar()
+
+    session.status_bar.update.assert_not_called()
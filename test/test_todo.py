@@ -0,0 +1,52 @@
+"""Tests for TodoList status bookkeeping."""
+
+from agent.todo import TodoList
+
+
+class TestTodoList:
+    """Tests for TodoList summaries and status transitions."""
+
+    def _make_list(self) -> TodoList:
+        todos = TodoList()
+        todos.add("Read file", "Reading file")
+        todos.add("Edit file", "Editing file")
+        todos.add("Run tests", "Running tests")
+        return todos
+
+    def test_summary_tracks_transitions(self):
+        todos = self._make_list()
+        todos.update_status(1, "in_progress")
+        todos.update_status(1, "completed")
+        todos.update_status(2, "in_progress")
+
+        assert todos.get_summary() == {
+            "total": 3,
+            "pending": 1,
+            "in_progress": 1,
+            "completed": 1,
+        }
+        assert "1 completed, 1 in progress, 1 pending" in todos.format_list()
+
+    def test_only_one_in_progress(self):
+        todos = self._make_list()
+        todos.update_status(2, "in_progress")
+
+        result = todos.update_status(3, "in_progress")
+
+        assert result.startswith("Error: Task #2 is already in_progress")
+        assert todos.get_summary()["in_progress"] == 1
+
+    def test_remove_and_clear_completed_update_summary(self):
+        todos = self._make_list()
+        todos.update_status(1, "completed")
+        todos.update_status(2, "completed")
+        todos.remove(3)
+
+        assert todos.get_summary()["pending"] == 0
+        assert todos.clear_completed() == "Removed 2 completed todo(s)"
+        assert todos.get_summary() == {
+            "total": 0,
+            "pending": 0,
+            "in_progress": 0,
+            "completed": 0,
+        }
@@ -1,7 +1,8 @@
 """Unified multi-task tool for parallel sub-agent execution."""
 
 import asyncio
-from typing import TYPE_CHECKING, Any, Dict, List, Set
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from llm import LLMMessage
 
@@ -161,28 +162,32 @@ Input parameters:
         tools: List[Dict[str, Any]],
     ) -> Dict[int, str]:
         results: Dict[int, str] = {}
-        completed: Set[int] = set()
         task_count = len(tasks)
 
-        deps: Dict[int, Set[int]] = {}
+        # Track how many prerequisites each task is still waiting on, plus a
+        # reverse index of dependents, so finishing a task only touches the
+        # tasks that depend on it instead of rescanning the whole list.
+        remaining: Dict[int, int] = {i: 0 for i in range(task_count)}
+        dependents: Dict[int, List[int]] = {i: [] for i in range(task_count)}
         for task_idx, dep_list in dependencies.items():
-            deps[int(task_idx)] = {int(d) for d in dep_list}
-
-        while len(completed) < task_count:
-            ready = [
-                i
-                for i in range(task_count)
-                if i not in completed and deps.get(i, set()).issubset(completed)
-            ]
-            if not ready:
-                break
-
-            batch = ready[: self.MAX_PARALLEL]
+            idx = int(task_idx)
+            dep_set = {int(d) for d in dep_list}
+            remaining[idx] = len(dep_set)
+            for dep in dep_set:
+                dependents[dep].append(idx)
+
+        ready = deque(i for i in range(task_count) if remaining[i] == 0)
+
+        while ready:
+            batch = [ready.popleft() for _ in range(min(self.MAX_PARALLEL, len(ready)))]
             batch_results = await self._execute_batch(batch, tasks, tools, results)
 
             for idx, result in batch_results.items():
                 results[idx] = result
-                completed.add(idx)
+                for dependent in dependents[idx]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        ready.append(dependent)
 
         return results
 
@@ -183,15 +183,32 @@ async def pick_model_id(model_manager: _ModelManager, title: str) -> str | None:
     return await app.run_async()
 
 
+_SHORT_SECRET_MASK = "*" * 8
+
+
 def mask_secret(value: str | None) -> str:
     if not value:
         return "(not set)"
     v = value.strip()
-    if len(v) <= 8:
-        return "*" * len(v)
+    if len(v) <= len(_SHORT_SECRET_MASK):
+        return _SHORT_SECRET_MASK[: len(v)]
     return f"{v[:4]}…{v[-4:]}"
 
 
+def split_command_args(text: str) -> list[str]:
+    """Split a slash command into tokens with shell-style quoting.
+
+    Plain input (the common `/model` and `/model <id>` cases) is split with
+    str.split; shlex only runs when quotes or escapes are present.
+
+    Raises:
+        ValueError: If the quoting is malformed.
+    """
+    if '"' not in text and "'" not in text and "\\" not in text:
+        return text.split()
+    return shlex.split(text)
+
+
 def parse_kv_args(tokens: list[str]) -> tuple[dict[str, str], list[str]]:
     kv: dict[str, str] = {}
     rest: list[str] = []
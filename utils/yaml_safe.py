@@ -0,0 +1,10 @@
+"""Safe YAML loader/dumper classes for ouro's YAML files.
+
+Uses libyaml's C parser/emitter when PyYAML was built with it; the C
+classes have the same safe semantics as the pure-Python ones.
+"""
+
+import yaml
+
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)